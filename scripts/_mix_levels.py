@@ -0,0 +1,27 @@
+"""
+Mix level helpers for the production scripts.
+
+Track levels are written in dB in the scripts and sent to Bitwig as a
+linear volume (0-1), derived once when each track's settings are built.
+"""
+
+from dataclasses import dataclass, field
+
+
+def db_to_linear(db: float) -> float:
+    """Convert a level in dB to a linear volume (0-1)."""
+    return 10 ** (db / 20)
+
+
+@dataclass(frozen=True)
+class DbLevel:
+    """Base for frozen track settings with a db field.
+
+    Adds volume, the linear (0-1) form of db. Subclasses declare db
+    themselves so it keeps its place in their positional arguments.
+    """
+
+    volume: float = field(init=False)  # linear (0-1), derived from db
+
+    def __post_init__(self):
+        object.__setattr__(self, 'volume', db_to_linear(self.db))
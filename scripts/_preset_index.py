@@ -0,0 +1,63 @@
+"""
+Index of Bitwig Essentials presets for the production scripts.
+
+Walks the Essentials presets directory once with os.scandir and maps
+"Device/Preset Name" to the preset file. The index is pickled to
+~/.cache/bwctl/presets.pkl and reused until a device directory changes.
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+PRESETS_ROOT = Path(
+    '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio'
+    '/installed-packages/5.0/Bitwig/Essentials/Presets'
+)
+
+CACHE_PATH = Path.home() / '.cache' / 'bwctl' / 'presets.pkl'
+
+
+def _stamp(root: Path) -> tuple[float, ...]:
+    """Modification times of the root and each device directory.
+
+    Adding, removing or renaming a preset changes its device directory's
+    mtime, so this is enough to detect a stale index.
+    """
+    with os.scandir(root) as entries:
+        mtimes = sorted(entry.stat().st_mtime for entry in entries if entry.is_dir())
+    return (root.stat().st_mtime, *mtimes)
+
+
+def build_preset_index(root: Path = PRESETS_ROOT) -> dict[str, Path]:
+    """Walk the presets directory and map "Device/Preset Name" to each file."""
+    index = {}
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith('.bwpreset'):
+                    path = Path(entry.path)
+                    index[path.relative_to(root).with_suffix('').as_posix()] = path
+    return index
+
+
+def load_preset_index(root: Path = PRESETS_ROOT) -> dict[str, Path]:
+    """Load the preset index, rebuilding it if the presets have changed."""
+    stamp = _stamp(root)
+
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached_root, cached_stamp, index = pickle.load(f)
+        if cached_root == root and cached_stamp == stamp:
+            return index
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    index = build_preset_index(root)
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH, 'wb') as f:
+        pickle.dump((root, stamp, index), f)
+    return index
@@ -5,7 +5,7 @@ Load Midwest Meridian MIDI files into Bitwig tracks.
 Inserts each MIDI file into clip slot 1 of its corresponding track.
 """
 
-import time
+import os
 import sys
 sys.path.insert(0, '/Users/bedwards/find-all-bitwig/src')
 
@@ -25,24 +25,30 @@ MIDI_FILES = {
     8: 'vocal.mid',
 }
 
-def main():
-    print("""
-╔══════════════════════════════════════════════════════════════╗
-║         LOADING MIDI INTO BITWIG - MIDWEST MERIDIAN          ║
-╚══════════════════════════════════════════════════════════════╝
-""")
+# Seconds to wait for Bitwig to confirm each insert
+INSERT_TIMEOUT = 2.0
+
+# Track number -> absolute MIDI path
+MIDI_PATHS = {track_num: f"{MIDI_DIR}/{midi_file}" for track_num, midi_file in MIDI_FILES.items()}
 
-    bridge = BitwigOSCBridge()
 
-    for track_num, midi_file in MIDI_FILES.items():
-        midi_path = f"{MIDI_DIR}/{midi_file}"
-        print(f"Track {track_num}: {midi_file}")
+def check_midi_files():
+    """Fail fast if any MIDI file is missing, before any OSC is sent.
 
-        # Insert MIDI file into clip slot 1
-        bridge.insert_clip_file(track_num, 1, midi_path)
-        time.sleep(0.5)
+    Bitwig silently ignores inserts of missing files.
+    """
+    missing = [path for path in MIDI_PATHS.values() if not os.path.isfile(path)]
+    if missing:
+        raise FileNotFoundError("Missing MIDI files:\n  " + "\n  ".join(missing))
+
+
+_BANNER_START = """
+╔══════════════════════════════════════════════════════════════╗
+║         LOADING MIDI INTO BITWIG - MIDWEST MERIDIAN          ║
+╚══════════════════════════════════════════════════════════════╝
+"""
 
-    print("""
+_BANNER_END = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                    MIDI LOADED                                ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -55,7 +61,37 @@ Next steps:
 3. Listen and adjust levels
 
 "Let the song breathe."
-""")
+"""
+
+
+def main():
+    print(_BANNER_START)
+
+    check_midi_files()
+    bridge = BitwigOSCBridge()
+    bridge.start_server()  # Listen for Bitwig's clip updates
+
+    meters_off = False
+    try:
+        # Stop meter updates flooding the receive path while we wait for clips
+        bridge.set_vu_meters(False)
+        meters_off = True
+
+        for track_num, midi_file in MIDI_FILES.items():
+            midi_path = MIDI_PATHS[track_num]
+            print(f"Track {track_num}: {midi_file}")
+
+            # Insert MIDI file into clip slot 1 and wait for Bitwig to report it
+            loaded = bridge.insert_clip_file(track_num, 1, midi_path)
+            if not loaded.wait(timeout=INSERT_TIMEOUT):
+                print("  (no confirmation from Bitwig, continuing)")
+    finally:
+        if meters_off:
+            # There is no OSC query for the meter state, so always turn them back on
+            bridge.set_vu_meters(True)
+        bridge.stop_server()
+
+    print(_BANNER_END)
 
 
 if __name__ == "__main__":
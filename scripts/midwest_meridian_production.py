@@ -15,148 +15,165 @@ Philosophy:
 - Honesty over polish
 """
 
-import time
+import asyncio
 import sys
+from dataclasses import dataclass
+from pathlib import Path
+
 sys.path.insert(0, '/Users/bedwards/find-all-bitwig/src')
 
-from bwctl.osc.bridge import BitwigOSCBridge
+from bwctl.osc.bridge import BitwigOSCBridge, ExpectedReply
+
+from _mix_levels import DbLevel
+from _preset_index import load_preset_index
 
-# Preset paths (found via database search)
+# Presets as "Device/Preset Name" under the Essentials presets directory
 PRESETS = {
     # Instruments
-    'old_nylon': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Poly Grid/Old Nylon.bwpreset',
-    'ambient_strings': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Phase-4/Ambient Strings.bwpreset',
-    'fm_violin': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/FM-4/FM Violin.bwpreset',
-    'jazz_guitar': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Poly Grid/Jazz Guitar.bwpreset',
-    'acoustic_bass': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Poly Grid/Acoustic Bass.bwpreset',
-    'bob_kick': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/E-Kick/BOB Kick.bwpreset',
-    'dark_snare': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/E-Snare/Dark Snare.bwpreset',
+    'old_nylon': 'Poly Grid/Old Nylon',
+    'ambient_strings': 'Phase-4/Ambient Strings',
+    'fm_violin': 'FM-4/FM Violin',
+    'jazz_guitar': 'Poly Grid/Jazz Guitar',
+    'acoustic_bass': 'Poly Grid/Acoustic Bass',
+    'bob_kick': 'E-Kick/BOB Kick',
+    'dark_snare': 'E-Snare/Dark Snare',
 
     # Effects
-    'room_one': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Reverb/Room One.bwpreset',
-    'room_two': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Reverb/Room Two.bwpreset',
-    'clean_amp': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Amp/Clean Guitar.bwpreset',
-    'guitar_comp': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Compressor+/Guitar Compressor.bwpreset',
-    'soft_comp': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Compressor/Soft Compression.bwpreset',
-    'mono_chorus': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/Chorus+/Mono K-Chorus.bwpreset',
-    'low_cut_eq': '/Users/bedwards/Library/Application Support/Bitwig/Bitwig Studio/installed-packages/5.0/Bitwig/Essentials/Presets/EQ-5/Low Cut EQ.bwpreset',
+    'room_one': 'Reverb/Room One',
+    'room_two': 'Reverb/Room Two',
+    'clean_amp': 'Amp/Clean Guitar',
+    'guitar_comp': 'Compressor+/Guitar Compressor',
+    'soft_comp': 'Compressor/Soft Compression',
+    'mono_chorus': 'Chorus+/Mono K-Chorus',
+    'low_cut_eq': 'EQ-5/Low Cut EQ',
 }
 
-# Volume levels in dB -> linear (0-1)
-# Formula: linear = 10^(dB/20)
-VOLUMES = {
-    'acoustic_guitar': 0.50,  # -6dB
-    'pedal_steel': 0.32,      # -10dB
-    'fiddle': 0.32,           # -10dB
-    'electric_guitar': 0.40,  # -8dB
-    'upright_bass': 0.50,     # -6dB
-    'kick': 0.40,             # -8dB
-    'snare': 0.32,            # -10dB
-    'vocal': 0.71,            # -3dB
-}
+# Full preset paths, filled in from the preset index by resolve_presets()
+PRESET_PATHS: dict[str, Path] = {}
+PRESET_NAMES: dict[str, str] = {key: name.rsplit('/', 1)[-1] for key, name in PRESETS.items()}
 
-# Pan values (-1 = full left, 0 = center, 1 = full right)
-PANS = {
-    'acoustic_guitar': -0.15,  # 15% left
-    'pedal_steel': 0.25,       # 25% right
-    'fiddle': -0.20,           # 20% left
-    'electric_guitar': 0.20,   # 20% right
-    'upright_bass': 0.00,      # center
-    'kick': 0.00,              # center
-    'snare': 0.00,             # center
-    'vocal': 0.00,             # center
-}
 
+@dataclass(frozen=True)
+class TrackSpec(DbLevel):
+    """Everything needed to set up one track."""
 
-def wait(seconds: float = 0.5):
-    """Wait between operations for Bitwig to process."""
-    time.sleep(seconds)
+    track: int
+    name: str
+    instrument: str | None  # PRESETS key, None for audio tracks
+    effects: list[str]      # PRESETS keys, in chain order
+    db: float               # volume in dB
+    pan: float              # -1 = full left, 0 = center, 1 = full right
 
 
-def setup_track(bridge: BitwigOSCBridge, track_num: int, name: str,
-                instrument_preset: str, effect_presets: list[str],
-                volume: float, pan: float):
-    """Set up a single track with instrument and effects.
+TRACKS: list[TrackSpec] = [
+    TrackSpec(1, "Acoustic Guitar", 'old_nylon', ['room_one'], -6, -0.15),
+    TrackSpec(
+        2, "Pedal Steel", 'ambient_strings', ['mono_chorus', 'room_two', 'low_cut_eq'], -10, 0.25
+    ),
+    TrackSpec(3, "Fiddle", 'fm_violin', ['room_one'], -10, -0.20),
+    TrackSpec(4, "Electric Guitar", 'jazz_guitar', ['clean_amp', 'room_two'], -8, 0.20),
+    TrackSpec(5, "Upright Bass", 'acoustic_bass', ['soft_comp'], -6, 0.00),
+    TrackSpec(6, "Kick", 'bob_kick', [], -8, 0.00),  # Keep it simple
+    TrackSpec(7, "Snare", 'dark_snare', ['room_one'], -10, 0.00),
+    # Vocal (audio track placeholder) - effects chain only, user will record audio
+    TrackSpec(8, "Vocal", None, ['low_cut_eq', 'soft_comp', 'room_one'], -3, 0.00),
+]
 
-    Order matters:
-    1. Add instrument preset (includes the instrument device)
-    2. Add effect presets in order
-    """
-    print(f"\n{'='*60}")
-    print(f"Track {track_num}: {name}")
-    print(f"{'='*60}")
 
-    # Select the track
-    bridge.select_track(track_num)
-    wait(0.3)
+# Bitwig has a single track selection, so the select -> insert stages of
+# different tracks must not interleave. The selection lock is only released
+# once Bitwig has confirmed (or failed to confirm in time) every insert.
 
-    # Add instrument preset
-    print(f"  + Instrument: {instrument_preset.split('/')[-1]}")
-    bridge.insert_preset(PRESETS[instrument_preset])
-    wait(0.5)
+# Seconds to wait for Bitwig to confirm a track selection / preset insert
+SELECT_TIMEOUT = 0.5
+INSERT_TIMEOUT = 2.0
 
-    # Add effect presets
-    for effect in effect_presets:
-        print(f"  + Effect: {effect.split('/')[-1]}")
-        bridge.insert_preset(PRESETS[effect])
-        wait(0.3)
 
-    # Set volume and pan
-    bridge.set_track_volume(track_num, volume)
-    wait(0.2)
-    bridge.set_track_pan(track_num, pan)
-    wait(0.2)
+def resolve_presets():
+    """Look up every preset in the index, failing fast before any OSC is sent."""
+    index = load_preset_index()
+    missing = [name for name in PRESETS.values() if name not in index]
+    if missing:
+        raise FileNotFoundError("Missing presets:\n  " + "\n  ".join(missing))
+    PRESET_PATHS.update((key, index[name]) for key, name in PRESETS.items())
 
-    print(f"  Volume: {volume:.2f} | Pan: {pan:+.2f}")
 
+async def confirm(reply: ExpectedReply, timeout: float) -> bool:
+    """Wait for a reply from Bitwig without blocking the other tracks."""
+    return await asyncio.to_thread(reply.wait, timeout)
 
-def setup_audio_track(bridge: BitwigOSCBridge, track_num: int, name: str,
-                      effect_presets: list[str], volume: float, pan: float):
-    """Set up an audio track (no instrument, just effects)."""
-    print(f"\n{'='*60}")
-    print(f"Track {track_num}: {name} (Audio)")
-    print(f"{'='*60}")
 
-    # Select the track
-    bridge.select_track(track_num)
-    wait(0.3)
+async def insert_preset(bridge: BitwigOSCBridge, key: str, label: str):
+    """Insert a preset by its PRESETS key and wait until Bitwig has loaded it.
+
+    The cursor device moves to the new device, so Bitwig reports its name
+    once it is in place.
+    """
+    print(f"  + {label}: {PRESET_NAMES[key]}")
+    loaded = bridge.expect("/device/name")
+    bridge.insert_preset(str(PRESET_PATHS[key]))
+    if not await confirm(loaded, INSERT_TIMEOUT):
+        print("    (no confirmation from Bitwig, continuing)")
+
+
+async def setup_track(bridge: BitwigOSCBridge, selection: asyncio.Lock, spec: TrackSpec):
+    """Set up a single track with instrument and effects.
+
+    Order matters:
+    1. Add instrument preset (includes the instrument device)
+    2. Add effect presets in order
+
+    Volume and pan are addressed by track index, so they are sent
+    straight away without waiting for the shared selection. The selection
+    is held from the select until Bitwig has reported the last insert, so
+    another track's select can't move the cursor while a preset loads.
+    """
+    with bridge.bundle():
+        bridge.set_track_volume(spec.track, spec.volume)
+        bridge.set_track_pan(spec.track, spec.pan)
+
+    async with selection:
+        suffix = "" if spec.instrument else " (Audio)"
+        print(f"\n{'='*60}")
+        print(f"Track {spec.track}: {spec.name}{suffix}")
+        print(f"{'='*60}")
 
-    # Add effect presets
-    for effect in effect_presets:
-        print(f"  + Effect: {effect.split('/')[-1]}")
-        bridge.insert_preset(PRESETS[effect])
-        wait(0.3)
+        # Select the track. Once Bitwig has reported it, feedback from the
+        # selection can't be mistaken for an insert confirmation. (A track
+        # that is already selected isn't reported, hence the short timeout.)
+        selected = bridge.expect(f"/track/{spec.track}/selected")
+        bridge.select_track(spec.track)
+        await confirm(selected, SELECT_TIMEOUT)
 
-    # Set volume and pan
-    bridge.set_track_volume(track_num, volume)
-    wait(0.2)
-    bridge.set_track_pan(track_num, pan)
-    wait(0.2)
+        # Add instrument preset, then effect presets
+        if spec.instrument:
+            await insert_preset(bridge, spec.instrument, "Instrument")
 
-    print(f"  Volume: {volume:.2f} | Pan: {pan:+.2f}")
+        for effect in spec.effects:
+            await insert_preset(bridge, effect, "Effect")
+
+        print(f"  Volume: {spec.db:+.0f}dB ({spec.volume:.2f}) | Pan: {spec.pan:+.2f}")
 
 
 def setup_master(bridge: BitwigOSCBridge):
     """Set up the master track with gentle processing."""
     print(f"\n{'='*60}")
     print("MASTER TRACK")
-    print("{'='*60}")
+    print(f"{'='*60}")
 
-    # Add EQ-5 (default, for gentle high-shelf air)
-    bridge.add_master_device("EQ-5")
-    wait(0.3)
-    print("  + EQ-5 (gentle high-shelf air)")
+    with bridge.bundle():
+        # Add EQ-5 (default, for gentle high-shelf air)
+        bridge.add_master_device("EQ-5")
+        print("  + EQ-5 (gentle high-shelf air)")
 
-    # Add Peak Limiter
-    bridge.add_master_device("Peak Limiter")
-    wait(0.3)
-    print("  + Peak Limiter (-1dB ceiling)")
+        # Add Peak Limiter
+        bridge.add_master_device("Peak Limiter")
+        print("  + Peak Limiter (-1dB ceiling)")
 
     print("\n  Philosophy: Warm, not loud. Preserve dynamics.")
 
 
-def main():
-    print("""
+_BANNER_START = """
 ╔══════════════════════════════════════════════════════════════╗
 ║            MIDWEST MERIDIAN - BITWIG PRODUCTION              ║
 ║                   Producer: Rick Rubin                       ║
@@ -167,75 +184,9 @@ Creating 8 tracks. Ensure Bitwig has a clean project with 8 empty
 instrument tracks already created.
 
 Tempo should be set to 95 BPM.
-""")
-
-    bridge = BitwigOSCBridge()
+"""
 
-    # Set tempo
-    print("Setting tempo to 95 BPM...")
-    bridge.set_tempo(95.0)
-    wait(0.5)
-
-    # Track 1: Acoustic Guitar
-    setup_track(bridge, 1, "Acoustic Guitar",
-                instrument_preset='old_nylon',
-                effect_presets=['room_one'],
-                volume=VOLUMES['acoustic_guitar'],
-                pan=PANS['acoustic_guitar'])
-
-    # Track 2: Pedal Steel
-    setup_track(bridge, 2, "Pedal Steel",
-                instrument_preset='ambient_strings',
-                effect_presets=['mono_chorus', 'room_two', 'low_cut_eq'],
-                volume=VOLUMES['pedal_steel'],
-                pan=PANS['pedal_steel'])
-
-    # Track 3: Fiddle
-    setup_track(bridge, 3, "Fiddle",
-                instrument_preset='fm_violin',
-                effect_presets=['room_one'],
-                volume=VOLUMES['fiddle'],
-                pan=PANS['fiddle'])
-
-    # Track 4: Electric Guitar
-    setup_track(bridge, 4, "Electric Guitar",
-                instrument_preset='jazz_guitar',
-                effect_presets=['clean_amp', 'room_two'],
-                volume=VOLUMES['electric_guitar'],
-                pan=PANS['electric_guitar'])
-
-    # Track 5: Upright Bass
-    setup_track(bridge, 5, "Upright Bass",
-                instrument_preset='acoustic_bass',
-                effect_presets=['soft_comp'],
-                volume=VOLUMES['upright_bass'],
-                pan=PANS['upright_bass'])
-
-    # Track 6: Kick
-    setup_track(bridge, 6, "Kick",
-                instrument_preset='bob_kick',
-                effect_presets=[],  # Keep it simple
-                volume=VOLUMES['kick'],
-                pan=PANS['kick'])
-
-    # Track 7: Snare
-    setup_track(bridge, 7, "Snare",
-                instrument_preset='dark_snare',
-                effect_presets=['room_one'],
-                volume=VOLUMES['snare'],
-                pan=PANS['snare'])
-
-    # Track 8: Vocal (audio track placeholder)
-    # For now, just set up effects chain - user will record audio
-    setup_audio_track(bridge, 8, "Vocal",
-                      effect_presets=['low_cut_eq', 'soft_comp', 'room_one'],
-                      volume=VOLUMES['vocal'],
-                      pan=PANS['vocal'])
-
-    # Master track
-    setup_master(bridge)
-
-    print("""
+_BANNER_END = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                    PRODUCTION COMPLETE                        ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -264,8 +215,39 @@ MANUAL STEPS REQUIRED:
 4. REMEMBER:
    "Let the song breathe. Less is more."
    - Rick Rubin
-""")
+"""
+
+
+async def main():
+    print(_BANNER_START)
+
+    resolve_presets()
+    bridge = BitwigOSCBridge()
+    bridge.start_server()  # Listen for Bitwig's insert confirmations
+
+    meters_off = False
+    try:
+        # Stop meter updates flooding the connection while we work
+        bridge.set_vu_meters(False)
+        meters_off = True
+
+        # Set tempo
+        print("Setting tempo to 95 BPM...")
+        bridge.set_tempo(95.0)
+
+        selection = asyncio.Lock()
+        await asyncio.gather(*(setup_track(bridge, selection, spec) for spec in TRACKS))
+
+        # Master track
+        setup_master(bridge)
+    finally:
+        if meters_off:
+            # There is no OSC query for the meter state, so always turn them back on
+            bridge.set_vu_meters(True)
+        bridge.stop_server()
+
+    print(_BANNER_END)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -15,93 +15,83 @@ Track layout with group buses:
 - Track 10: Vocal
 """
 
-import time
 import sys
+from dataclasses import dataclass
+
 sys.path.insert(0, '/Users/bedwards/find-all-bitwig/src')
 
 from bwctl.osc.bridge import BitwigOSCBridge
 
+from _mix_levels import DbLevel
 
-# dB to linear: linear = 10^(dB/20)
-# -3dB = 0.71, -4dB = 0.63, -6dB = 0.50, -8dB = 0.40, -10dB = 0.32
-
-# Group tracks - OSC cannot set these (manual adjustment required)
-GROUP_TRACKS = {1, 6}
-
-MIX_SETTINGS = {
-    # Track: (volume_linear, pan)
-    1: (0.71, 0.00),   # Instruments Bus: -3dB, center [GROUP - MANUAL]
-    2: (0.50, -0.15),  # Acoustic Guitar: -6dB, 15% left
-    3: (0.32, 0.25),   # Pedal Steel: -10dB, 25% right
-    4: (0.32, -0.20),  # Fiddle: -10dB, 20% left
-    5: (0.40, 0.20),   # Electric Guitar: -8dB, 20% right
-    6: (0.63, 0.00),   # Rhythm Bus: -4dB, center [GROUP - MANUAL]
-    7: (0.50, 0.00),   # Upright Bass: -6dB, center
-    8: (0.40, 0.00),   # Kick: -8dB, center
-    9: (0.32, 0.00),   # Snare: -10dB, center
-    10: (0.71, 0.00),  # Vocal: -3dB, center
-}
-
-TRACK_NAMES = {
-    1: "Instruments Bus",
-    2: "Acoustic Guitar",
-    3: "Pedal Steel",
-    4: "Fiddle",
-    5: "Electric Guitar",
-    6: "Rhythm Bus",
-    7: "Upright Bass",
-    8: "Kick",
-    9: "Snare",
-    10: "Vocal",
-}
-
-
-def linear_to_db(linear: float) -> float:
-    """Convert linear volume to dB."""
-    import math
-    if linear <= 0:
-        return float('-inf')
-    return 20 * math.log10(linear)
 
+@dataclass(frozen=True)
+class TrackMix(DbLevel):
+    """Mix settings for one track."""
 
-def main():
-    print("""
+    track: int
+    name: str
+    db: float               # volume in dB
+    pan: float              # -1 = full left, 0 = center, 1 = full right
+    is_group: bool = False  # OSC cannot set group volumes (manual adjustment required)
+
+
+MIX_SETTINGS: list[TrackMix] = [
+    TrackMix(1, "Instruments Bus", -3, 0.00, is_group=True),
+    TrackMix(2, "Acoustic Guitar", -6, -0.15),
+    TrackMix(3, "Pedal Steel", -10, 0.25),
+    TrackMix(4, "Fiddle", -10, -0.20),
+    TrackMix(5, "Electric Guitar", -8, 0.20),
+    TrackMix(6, "Rhythm Bus", -4, 0.00, is_group=True),
+    TrackMix(7, "Upright Bass", -6, 0.00),
+    TrackMix(8, "Kick", -8, 0.00),
+    TrackMix(9, "Snare", -10, 0.00),
+    TrackMix(10, "Vocal", -3, 0.00),
+]
+
+
+_BANNER_START = """
 +--------------------------------------------------------------+
 |         MIDWEST MERIDIAN - SETTING MIX LEVELS                |
 +--------------------------------------------------------------+
-""")
+"""
+
+_BANNER_END = """
++--------------------------------------------------------------+
+|                    MIX LEVELS SET                            |
++--------------------------------------------------------------+
+
+"When you listen back, close your eyes.
+If you don't feel something, the mix isn't done."
+                                        - Rick Rubin
+"""
+
+
+def main():
+    print(_BANNER_START)
 
     bridge = BitwigOSCBridge()
 
-    for track_num, (volume, pan) in MIX_SETTINGS.items():
-        name = TRACK_NAMES[track_num]
-        db = linear_to_db(volume)
+    states = []
+    for mix in MIX_SETTINGS:
+        pan = mix.pan
         pan_str = "center" if pan == 0 else f"{abs(pan)*100:.0f}% {'left' if pan < 0 else 'right'}"
+        line = f"Track {mix.track:2d}: {mix.name:20s} | {mix.db:+.0f}dB | {pan_str}"
 
         # Skip group tracks - OSC cannot set their volumes
-        if track_num in GROUP_TRACKS:
-            print(f"Track {track_num:2d}: {name:20s} | {db:+.0f}dB | {pan_str} [SKIP - set manually]")
+        if mix.is_group:
+            print(f"{line} [SKIP - set manually]")
             continue
 
-        print(f"Track {track_num:2d}: {name:20s} | {db:+.0f}dB | {pan_str}")
-
-        # Set volume
-        bridge.set_track_volume(track_num, volume)
-        time.sleep(0.2)
+        print(line)
+        states.append((mix.track, "volume", mix.volume))
+        states.append((mix.track, "pan", mix.pan))
 
-        # Set pan
-        bridge.set_track_pan(track_num, pan)
-        time.sleep(0.2)
+    # Every track's volume and pan in one bundle (addressed by index, no
+    # ordering needed), a single datagram for the whole mix
+    bridge.set_track_states(states)
 
-    print("""
-+--------------------------------------------------------------+
-|                    MIX LEVELS SET                            |
-+--------------------------------------------------------------+
-
-"When you listen back, close your eyes.
-If you don't feel something, the mix isn't done."
-                                        - Rick Rubin
-""")
+    print(_BANNER_END)
 
 
 if __name__ == "__main__":
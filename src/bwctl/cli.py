@@ -1,20 +1,72 @@
 """Main CLI entry point for bwctl."""
 
+import importlib
 import logging
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+
+# Newer typer releases build on their own copy of click rather than the
+# click package, so the group overrides must use the same classes
+try:
+    from typer import _click as click
+except ImportError:
+    import click  # type: ignore[no-redef,import-not-found,unused-ignore]
 
 from bwctl import __version__
-from bwctl.commands import clip, device, index, track, transport
-from bwctl.commands.insert import insert as insert_cmd
-from bwctl.commands.search import search as search_cmd, stats as stats_cmd
 
-console = Console()
+# Commands that live in bwctl.commands, as "module:attribute". They are only
+# imported when invoked (or listed in --help), so cheap commands like
+# `bwctl version` don't pay for the OSC, database and settings imports.
+LAZY_COMMANDS: dict[str, str] = {
+    # Command groups
+    "index": "bwctl.commands.index:app",
+    "track": "bwctl.commands.track:app",
+    "device": "bwctl.commands.device:app",
+    "clip": "bwctl.commands.clip:app",
+    "transport": "bwctl.commands.transport:app",
+    # Direct commands
+    "search": "bwctl.commands.search:search",
+    "s": "bwctl.commands.search:search",  # Quick alias
+    "stats": "bwctl.commands.search:stats",
+    "insert": "bwctl.commands.insert:insert",
+}
+
+
+def load_command(name: str) -> click.Command:
+    """Import a lazy command and convert it to a Typer command."""
+    module_name, attr = LAZY_COMMANDS[name].split(":")
+    target = getattr(importlib.import_module(module_name), attr)
+
+    if isinstance(target, typer.Typer):
+        sub_app = target
+    else:
+        # Plain command function: wrap it in a single-command app
+        sub_app = typer.Typer()
+        sub_app.command(name=name)(target)
+
+    command = typer.main.get_command(sub_app)
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves LAZY_COMMANDS on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *LAZY_COMMANDS]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in LAZY_COMMANDS:
+            return load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
     name="bwctl",
     help="Bitwig Studio command line controller",
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
 
@@ -26,63 +78,78 @@ def main(
     if debug:
         logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
 
-# Register command groups
-app.add_typer(index.app, name="index")
-app.add_typer(track.app, name="track")
-app.add_typer(device.app, name="device")
-app.add_typer(clip.app, name="clip")
-app.add_typer(transport.app, name="transport")
-
-# Register direct commands
-app.command(name="search")(search_cmd)
-app.command(name="stats")(stats_cmd)
-app.command(name="insert")(insert_cmd)
-
 
 @app.command()
 def version() -> None:
     """Show version information."""
-    console.print(f"bwctl version {__version__}")
+    typer.echo(f"bwctl version {__version__}")
 
 
-@app.command(name="s")
-def search_shortcut(
-    query: str = typer.Argument(..., help="Search query"),
-    content_type: str = typer.Option(None, "-t", "--type"),
-    device: str = typer.Option(None, "-d", "--device"),
-    limit: int = typer.Option(20, "-n", "--limit"),
-) -> None:
-    """Quick search (alias for 'search').
+@app.command()
+def repl() -> None:
+    """Run bwctl commands interactively.
+
+    Imports, settings and the OSC bridge's send socket are set up once
+    and shared by every command in the session.
 
-    Example: bwctl s "warm pad"
+    Example:
+        bwctl repl
+        bwctl> track list
+        bwctl> track mute 1 2
     """
-    search_cmd(
-        query=query,
-        content_type=content_type,
-        device=device,
-        category=None,
-        limit=limit,
-        offset=0,
-        output="table",
-    )
+    import shlex
+
+    while True:
+        try:
+            line = input("bwctl> ")
+        except (EOFError, KeyboardInterrupt):
+            typer.echo()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+
+        try:
+            app(args, prog_name="bwctl")
+        except SystemExit:
+            pass  # Commands exit when they finish, even on success
+        except KeyboardInterrupt:
+            typer.echo("Interrupted", err=True)  # Stops the command, not the session
+        except Exception as e:
+            # e.g. the database or Bitwig being unreachable
+            typer.echo(f"Error: {e}", err=True)
 
 
 # Transport shortcuts
 @app.command()
 def play() -> None:
     """Start playback (shortcut for 'transport play')."""
+    from bwctl.commands import transport
+
     transport.play()
 
 
 @app.command()
 def stop() -> None:
     """Stop playback (shortcut for 'transport stop')."""
+    from bwctl.commands import transport
+
     transport.stop()
 
 
 @app.command()
 def rec() -> None:
     """Toggle recording (shortcut for 'transport record')."""
+    from bwctl.commands import transport
+
     transport.record()
 
 
@@ -1,5 +1,6 @@
 """Clip command for bwctl."""
 
+import re
 from typing import Optional
 
 import typer
@@ -11,21 +12,32 @@ console = Console()
 
 app = typer.Typer(help="Clip operations")
 
+# Options shared by several commands, built once at import
+TRACK_OPTION = typer.Option(1, "-t", "--track", help="Track number")
+SLOT_OPTION = typer.Option(1, "-s", "--slot", help="Slot number")
+
+# "track:slot", or just "slot" (track defaults to 1)
+CLIP_REF_RE = re.compile(r"(?:(\d+):)?(\d+)")
+
 
 def parse_clip_ref(ref: str) -> tuple[int, int]:
-    """Parse a clip reference like '1:2' into (track, slot)."""
-    if ":" in ref:
-        parts = ref.split(":")
-        return int(parts[0]), int(parts[1])
-    else:
-        # Just a slot number, assume current track
-        return 1, int(ref)
+    """Parse a clip reference like '1:2' into (track, slot).
+
+    Raises:
+        ValueError: If the reference is malformed
+    """
+    match = CLIP_REF_RE.fullmatch(ref)
+    if match is None:
+        raise ValueError(f"Invalid clip reference: {ref}")
+    track, slot = match.groups()
+    # Just a slot number, assume current track
+    return int(track) if track else 1, int(slot)
 
 
 @app.command()
 def create(
-    track: int = typer.Option(1, "-t", "--track", help="Track number"),
-    slot: int = typer.Option(1, "-s", "--slot", help="Slot number"),
+    track: int = TRACK_OPTION,
+    slot: int = SLOT_OPTION,
     length: int = typer.Option(4, "-l", "--length", help="Clip length in beats"),
     name: Optional[str] = typer.Option(None, "-n", "--name", help="Clip name"),
 ) -> None:
@@ -53,16 +65,21 @@ def launch(
         bwctl clip launch 1:1
         bwctl clip launch 1:1 2:1 3:1
     """
-    bridge = get_bridge()
-
+    clips = []
+    lines = []  # Printed together at the end
     for ref in clip_refs:
         try:
-            track, slot = parse_clip_ref(ref)
-            bridge.launch_clip(track, slot)
-            console.print(f"[green]Launched clip {track}:{slot}[/green]")
+            clips.append(parse_clip_ref(ref))
         except ValueError:
-            console.print(f"[red]Invalid clip reference: {ref}[/red]")
-            console.print("[dim]Format: track:slot (e.g., 1:1)[/dim]")
+            lines.append(f"[red]Invalid clip reference: {ref}[/red]")
+            lines.append("[dim]Format: track:slot (e.g., 1:1)[/dim]")
+
+    # Launch all clips in one bundle so they start in sync
+    bridge = get_bridge()
+    bridge.launch_clips(clips)
+
+    lines.extend(f"[green]Launched clip {track}:{slot}[/green]" for track, slot in clips)
+    console.print("\n".join(lines))
 
 
 @app.command()
@@ -88,19 +105,24 @@ def stop(
         console.print("[red]Specify clip references or use --all[/red]")
         raise typer.Exit(1)
 
+    clips = []
+    lines = []  # Printed together at the end
     for ref in clip_refs:
         try:
-            track, slot = parse_clip_ref(ref)
-            bridge.stop_clip(track, slot)
-            console.print(f"[green]Stopped clip {track}:{slot}[/green]")
+            clips.append(parse_clip_ref(ref))
         except ValueError:
-            console.print(f"[red]Invalid clip reference: {ref}[/red]")
+            lines.append(f"[red]Invalid clip reference: {ref}[/red]")
+
+    bridge.stop_clips(clips)
+
+    lines.extend(f"[green]Stopped clip {track}:{slot}[/green]" for track, slot in clips)
+    console.print("\n".join(lines))
 
 
 @app.command()
 def record(
-    track: int = typer.Option(1, "-t", "--track", help="Track number"),
-    slot: int = typer.Option(1, "-s", "--slot", help="Slot number"),
+    track: int = TRACK_OPTION,
+    slot: int = SLOT_OPTION,
 ) -> None:
     """Start recording into a clip slot.
 
@@ -109,9 +131,8 @@ def record(
     """
     bridge = get_bridge()
 
-    # Create clip if needed and start recording
-    bridge.create_clip(track, slot, 4)  # Default 4 beats
-    bridge.launch_clip(track, slot)
+    # Create clip if needed and start recording, in one bundle
+    bridge.record_clip(track, slot, 4)  # Default 4 beats
 
     console.print(f"[red]Recording to track {track}, slot {slot}[/red]")
     console.print("[dim]Press stop or launch again to finish[/dim]")
@@ -120,8 +141,8 @@ def record(
 @app.command("insert")
 def insert_file(
     file_path: str = typer.Argument(..., help="Path to MIDI or audio file"),
-    track: int = typer.Option(1, "-t", "--track", help="Track number"),
-    slot: int = typer.Option(1, "-s", "--slot", help="Slot number"),
+    track: int = TRACK_OPTION,
+    slot: int = SLOT_OPTION,
 ) -> None:
     """Insert a MIDI or audio file into a clip launcher slot.
 
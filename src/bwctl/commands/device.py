@@ -1,15 +1,13 @@
 """Device command for bwctl."""
 
 import logging
-import time
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from bwctl.osc.bridge import get_bridge, BitwigOSCBridge
-from bwctl.db.search import search_content
+from bwctl.osc.bridge import AsyncBitwigOSCBridge, get_bridge, run_async
+from bwctl.db.cache import cached_search
 from bwctl.db.models import ContentType
 
 console = Console()
@@ -17,6 +15,34 @@ logger = logging.getLogger(__name__)
 
 app = typer.Typer(help="Device operations")
 
+# Option shared by several commands, built once at import
+TRACK_OPTION = typer.Option(None, "-t", "--track", help="Target track")
+
+# Upper bounds on waiting for device info from Bitwig (seconds)
+FIRST_DEVICE_TIMEOUT = 0.8
+NEXT_DEVICE_TIMEOUT = 0.2
+ENABLED_TIMEOUT = 0.02
+
+
+async def _scan_devices(track: int, count: int) -> list[dict[str, Any]]:
+    """Collect the device chain of a track from Bitwig's replies."""
+    devices: list[dict[str, Any]] = []
+    async with AsyncBitwigOSCBridge() as bridge:
+        scan = bridge.iter_devices(
+            track,
+            count,
+            first_timeout=FIRST_DEVICE_TIMEOUT,
+            next_timeout=NEXT_DEVICE_TIMEOUT,
+            enabled_timeout=ENABLED_TIMEOUT,
+        )
+        async for name, bypassed in scan:
+            devices.append({
+                "num": len(devices) + 1,
+                "name": name,
+                "bypassed": bypassed
+            })
+    return devices
+
 
 @app.command("list")
 def list_devices(
@@ -30,80 +56,35 @@ def list_devices(
         bwctl device list -t 1
         bwctl device list -n 16
     """
-    bridge = BitwigOSCBridge()
-    devices = []
-    current = {"name": None, "bypassed": None}
-
-    def handle_osc(address, *args):
-        logger.debug(f"OSC RECV: {address} {args}")
-        if "/device/name" in address and args:
-            current["name"] = args[0] if args[0] else None
-        elif "/device/isEnabled" in address and args:
-            current["bypassed"] = not args[0]
-
-    bridge.dispatcher.set_default_handler(handle_osc)
-    bridge.start_server()  # Start server FIRST to catch responses
-
     console.print(f"[dim]Scanning device chain...[/dim]")
 
-    # Select track to trigger device info (AFTER server fully started)
-    target_track = track or 1
-    bridge.select_track(target_track)
-
-    # Wait for OSC response (device info takes time to arrive)
-    time.sleep(0.8)
-
-    # Check first device
-    if current["name"]:
-        devices.append({
-            "num": 1,
-            "name": current["name"],
-            "bypassed": current["bypassed"]
-        })
-    else:
-        # No device on this track
-        bridge.stop_server()
+    devices = run_async(_scan_devices(track or 1, count))
+    if not devices:
         console.print("[yellow]No devices found on track[/yellow]")
         return
 
-    # Navigate through siblings
-    for i in range(2, count + 1):
-        prev_name = current["name"]
-        current["name"] = None
-        current["bypassed"] = None
-        bridge.select_next_device()
-        time.sleep(0.2)
-
-        if current["name"] and current["name"] != prev_name:
-            devices.append({
-                "num": i,
-                "name": current["name"],
-                "bypassed": current["bypassed"]
-            })
-        else:
-            break  # No more devices or looped back
-
-    bridge.stop_server()
+    from rich.table import Table
 
-    # Build table
-    table = Table(title="Device Chain")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Device", style="cyan")
-    table.add_column("Status", style="green")
+    # Build table, with fixed column widths so rich needn't measure rows
+    table = Table(title="Device Chain", box=None, pad_edge=False, show_edge=False)
+    table.add_column("#", style="dim", width=4, no_wrap=True)
+    table.add_column("Device", style="cyan", width=30, no_wrap=True)
+    table.add_column("Status", style="green", width=8, no_wrap=True)
 
     for dev in devices:
         status = "[yellow]Bypassed[/yellow]" if dev["bypassed"] else "Active"
         table.add_row(str(dev["num"]), dev["name"], status)
 
-    console.print(table)
-    console.print(f"\n[dim]Found {len(devices)} devices[/dim]")
+    console.print(table, f"\n[dim]Found {len(devices)} devices[/dim]")
 
 
 @app.command()
 def add(
     name: str = typer.Argument(..., help="Device name (exact match for Bitwig devices)"),
-    track: Optional[int] = typer.Option(None, "-t", "--track", help="Target track"),
-    browse: bool = typer.Option(False, "--browse", "-b", help="Open browser instead of direct insert"),
+    track: Optional[int] = TRACK_OPTION,
+    browse: bool = typer.Option(
+        False, "--browse", "-b", help="Open browser instead of direct insert"
+    ),
 ) -> None:
     """Add a device to the current or specified track.
 
@@ -139,7 +120,7 @@ def add(
 def load(
     preset_name: str = typer.Argument(..., help="Preset name to search and load"),
     device: Optional[str] = typer.Option(None, "-d", "--device", help="Filter by device name"),
-    track: Optional[int] = typer.Option(None, "-t", "--track", help="Target track"),
+    track: Optional[int] = TRACK_OPTION,
 ) -> None:
     """Load a preset by name (searches database and inserts the .bwpreset file).
 
@@ -151,14 +132,15 @@ def load(
         bwctl device load "Dark Snare" -t 7
     """
     bridge = get_bridge()
+    lines = []  # Printed together at the end
 
     # Select track if specified
     if track:
         bridge.select_track(track)
-        console.print(f"[dim]Selected track {track}[/dim]")
+        lines.append(f"[dim]Selected track {track}[/dim]")
 
-    # Search for preset in database
-    results = search_content(
+    # Search for preset in database (cached across invocations)
+    results = cached_search(
         query=preset_name,
         content_type=ContentType.PRESET,
         limit=5,
@@ -166,25 +148,31 @@ def load(
 
     # Filter by device if specified
     if device and results:
-        results = [r for r in results if r.parent_device and device.lower() in r.parent_device.lower()]
+        device_cf = device.casefold()
+        results = [
+            r for r in results if r.parent_device and device_cf in r.parent_device.casefold()
+        ]
 
     if not results:
-        console.print(f"[red]No preset found for:[/red] {preset_name}")
+        lines.append(f"[red]No preset found for:[/red] {preset_name}")
         if device:
-            console.print(f"[dim]Filtered by device: {device}[/dim]")
+            lines.append(f"[dim]Filtered by device: {device}[/dim]")
+        console.print("\n".join(lines))
         raise typer.Exit(1)
 
     # Use the first match
     best_match = results[0]
     if not best_match.file_path:
-        console.print(f"[red]Preset found but no file path:[/red] {best_match.name}")
+        lines.append(f"[red]Preset found but no file path:[/red] {best_match.name}")
+        console.print("\n".join(lines))
         raise typer.Exit(1)
 
     # Insert the preset file
     bridge.insert_preset(best_match.file_path)
-    console.print(f"[green]Loaded preset:[/green] {best_match.name}")
+    lines.append(f"[green]Loaded preset:[/green] {best_match.name}")
     if best_match.parent_device:
-        console.print(f"[dim]Device: {best_match.parent_device}[/dim]")
+        lines.append(f"[dim]Device: {best_match.parent_device}[/dim]")
+    console.print("\n".join(lines))
 
 
 @app.command()
@@ -232,7 +220,7 @@ def bypass(
 def param(
     name: Optional[str] = typer.Option(None, "-n", "--name", help="Parameter name"),
     index: Optional[int] = typer.Option(None, "-i", "--index", help="Parameter index (1-8)"),
-    value: float = typer.Argument(..., help="Parameter value (0.0 to 1.0)"),
+    value: float = typer.Argument(..., min=0.0, max=1.0, help="Parameter value (0.0 to 1.0)"),
 ) -> None:
     """Set a device parameter value.
 
@@ -244,10 +232,6 @@ def param(
         console.print("[red]Specify either --index or --name[/red]")
         raise typer.Exit(1)
 
-    if value < 0 or value > 1:
-        console.print("[red]Value must be between 0.0 and 1.0[/red]")
-        raise typer.Exit(1)
-
     bridge = get_bridge()
 
     if index:
@@ -4,9 +4,6 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-
-from bwctl.db.indexer import run_indexer
 
 console = Console()
 
@@ -19,13 +16,17 @@ def index(
     path: Optional[str] = typer.Option(None, "--path", help="Index specific path"),
     workers: int = typer.Option(4, "--workers", "-w", help="Parallel workers"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be indexed"),
+    dedup: bool = typer.Option(
+        False, "--dedup", help="Hash samples to find duplicates (reads every sample)"
+    ),
 ) -> None:
     """Index Bitwig content into the database.
 
     Examples:
         bwctl index --full
         bwctl index --path ~/Documents/Bitwig\\ Studio/Library
-        bwctl index --incremental
+        bwctl index            # Only new or changed files
+        bwctl index --dedup
     """
     paths = [path] if path else None
 
@@ -34,11 +35,21 @@ def index(
         # TODO: Implement dry run discovery
         return
 
+    from bwctl.db.connection import warm_pool_async
+
+    warm_pool_async()
+
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    from bwctl.db.indexer import run_indexer
+
     console.print("[bold]Indexing Bitwig content...[/bold]")
 
     if full:
         console.print("[yellow]Full reindex - clearing existing data[/yellow]")
 
+    # Only show the progress display on a terminal; piped output would
+    # just collect the redraws
     try:
         with Progress(
             SpinnerColumn(),
@@ -46,12 +57,14 @@ def index(
             BarColumn(),
             TaskProgressColumn(),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
             stats = run_indexer(
                 paths=paths,
                 full=full,
                 workers=workers,
                 progress=progress,
+                dedup=dedup,
             )
     except Exception as e:
         console.print(f"[red]Indexing failed: {e}[/red]")
@@ -62,5 +75,7 @@ def index(
     console.print("[bold green]Indexing complete![/bold green]")
     console.print(f"  Packages: {stats['packages']}")
     console.print(f"  Files:    {stats['files']}")
+    if stats["skipped"] > 0:
+        console.print(f"  [dim]Unchanged: {stats['skipped']}[/dim]")
     if stats['errors'] > 0:
         console.print(f"  [yellow]Errors:   {stats['errors']}[/yellow]")
@@ -6,87 +6,131 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from bwctl.db.search import get_content_by_id, search_content
+from bwctl.db.cache import cached_search
+from bwctl.db.indexer import EXTENSION_MAP
+from bwctl.db.search import get_content_by_id
 from bwctl.osc.bridge import get_bridge
 
 console = Console()
 
 
+def _has_directory(target: str) -> bool:
+    """Check if a target names a directory, so is certainly a file path."""
+    return "/" in target or target.startswith("~")
+
+
+def _looks_like_path(target: str) -> bool:
+    """Check if a target is meant as a file path rather than a search.
+
+    A dot alone doesn't count ("Vol. 2" is a preset name); the target must
+    name a directory or end in a content file extension.
+    """
+    return _has_directory(target) or Path(target).suffix.lower() in EXTENSION_MAP
+
+
+def _resolve_target(target: str, search: bool) -> tuple[str, str]:
+    """Find the file and display name for an insert target.
+
+    Only targets that look like paths touch the filesystem; any other word
+    is searched for, as is a bare file name that doesn't exist. Exits if
+    nothing matches.
+    """
+    if not search and _looks_like_path(target):
+        # File path
+        path = Path(target).expanduser()
+        if path.exists():
+            return str(path), path.stem
+        if _has_directory(target):
+            console.print(f"[red]File not found: {target}[/red]")
+            raise typer.Exit(1)
+
+    elif not search and target.isdigit():
+        # Content ID
+        content_id = int(target)
+        content = get_content_by_id(content_id)
+        if not content:
+            console.print(f"[red]Content ID {content_id} not found[/red]")
+            raise typer.Exit(1)
+
+        return content.file_path, content.name
+
+    # Search and use first result
+    results = cached_search(query=target, limit=1)
+    if not results:
+        console.print(f"[red]No results found for '{target}'[/red]")
+        raise typer.Exit(1)
+
+    result = results[0]
+    console.print(f"[dim]Found: {result.name} ({result.content_type.value})[/dim]")
+    return result.file_path, result.name
+
+
 def insert(
     target: str = typer.Argument(..., help="Content ID, file path, or search query"),
     search: bool = typer.Option(False, "-s", "--search", help="Treat target as search query"),
     track: Optional[int] = typer.Option(None, "-t", "--track", help="Target track number"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be inserted"),
+    browse: bool = typer.Option(
+        False, "--browse", "-b", help="Open browser instead of direct insert"
+    ),
 ) -> None:
     """Insert content into Bitwig.
 
     TARGET can be:
     - A content ID from search results (e.g., 42)
     - A file path (e.g., ~/presets/my-bass.bwpreset)
-    - A search query with --search flag
+    - A search query with --search flag (implied for anything that is
+      neither an ID nor path-like)
 
     Examples:
         bwctl insert 42
         bwctl insert ~/presets/my-bass.bwpreset
         bwctl insert --search "warm pad"
         bwctl insert -s "polymer bass" -t 1
+        bwctl insert "warm pad" --browse  # Use browser
     """
-    file_path: str | None = None
-    content_name: str = target
-
-    # Determine what type of target we have
-    if search:
-        # Search and use first result
-        results = search_content(query=target, limit=1)
-        if not results:
-            console.print(f"[red]No results found for '{target}'[/red]")
-            raise typer.Exit(1)
-
-        result = results[0]
-        file_path = result.file_path
-        content_name = result.name
-        console.print(f"[dim]Found: {result.name} ({result.content_type.value})[/dim]")
-
-    elif target.isdigit():
-        # Content ID
-        content_id = int(target)
-        result = get_content_by_id(content_id)
-        if not result:
-            console.print(f"[red]Content ID {content_id} not found[/red]")
-            raise typer.Exit(1)
-
-        file_path = result.file_path
-        content_name = result.name
-
+    # The browser does its own searching, so the target is only resolved
+    # for a direct insert
+    if browse:
+        file_path, content_name = None, target
     else:
-        # File path
-        path = Path(target).expanduser()
-        if not path.exists():
-            console.print(f"[red]File not found: {target}[/red]")
-            raise typer.Exit(1)
-
-        file_path = str(path)
-        content_name = path.stem
+        file_path, content_name = _resolve_target(target, search)
 
     if dry_run:
-        console.print(f"[yellow]Would insert:[/yellow] {content_name}")
-        console.print(f"[dim]  Path: {file_path}[/dim]")
+        if browse:
+            lines = [f"[yellow]Would open browser for:[/yellow] {content_name}"]
+        else:
+            lines = [
+                f"[yellow]Would insert:[/yellow] {content_name}",
+                f"[dim]  Path: {file_path}[/dim]",
+            ]
         if track:
-            console.print(f"[dim]  Track: {track}[/dim]")
+            lines.append(f"[dim]  Track: {track}[/dim]")
+        console.print("\n".join(lines))
         return
 
     # Get the OSC bridge
     bridge = get_bridge()
+    lines = []  # Printed together at the end
 
     # Select track if specified
     if track:
         bridge.select_track(track)
-        console.print(f"[dim]Selected track {track}[/dim]")
+        lines.append(f"[dim]Selected track {track}[/dim]")
+
+    if file_path is None:
+        # --browse: open the device browser for fuzzy search
+        bridge.open_device_browser()
+        lines.append(f"[green]Opening browser for:[/green] {content_name}")
+        lines.append("[dim]Use browser navigation or type to search[/dim]")
+        console.print("\n".join(lines))
+        return
 
     # Insert the preset via OSC /device/file command
-    console.print(f"[green]Inserting:[/green] {content_name}")
-    console.print(f"[dim]Path: {file_path}[/dim]")
+    lines.append(f"[green]Inserting:[/green] {content_name}")
+    lines.append(f"[dim]Path: {file_path}[/dim]")
 
     # Use /device/file OSC command to insert preset directly
     bridge.insert_preset(file_path)
-    console.print(f"[green]Inserted {content_name} on track {track or 'current'}[/green]")
+    lines.append(f"[green]Inserted {content_name} on track {track or 'current'}[/green]")
+    console.print("\n".join(lines))
@@ -1,21 +1,24 @@
 """Search command for bwctl."""
 
+import sys
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from bwctl.db.models import ContentType, DeviceType
-from bwctl.db.search import get_stats, search_content
+from bwctl.db.cache import cached_search
+from bwctl.db.models import ContentType, SearchResult
+from bwctl.db.search import get_stats
 
 console = Console()
 
 
 def search(
     query: str = typer.Argument(..., help="Search query (supports fuzzy matching)"),
-    content_type: Optional[str] = typer.Option(
-        None, "-t", "--type", help="Filter by type: preset, sample, clip, etc."
+    content_type: Optional[ContentType] = typer.Option(
+        None, "-t", "--type", case_sensitive=False,
+        help="Filter by type: preset, sample, clip, etc.",
     ),
     device: Optional[str] = typer.Option(
         None, "-d", "--device", help="Filter by parent device name"
@@ -36,21 +39,11 @@ def search(
         bwctl search "bass" -t preset -d Polymer
         bwctl search "kick" -t sample -c Drums
     """
-    # Parse content type
-    ct = None
-    if content_type:
-        try:
-            ct = ContentType(content_type.lower())
-        except ValueError:
-            console.print(f"[red]Invalid content type: {content_type}[/red]")
-            console.print(f"Valid types: {', '.join(t.value for t in ContentType)}")
-            raise typer.Exit(1)
-
     # Search
     try:
-        results = search_content(
+        results = cached_search(
             query=query,
-            content_type=ct,
+            content_type=content_type,
             parent_device=device,
             category=category,
             limit=limit,
@@ -67,12 +60,18 @@ def search(
 
     # Output results
     if output == "json":
-        import json
-        data = [r.model_dump() for r in results]
-        console.print(json.dumps(data, indent=2, default=str))
+        from pydantic import TypeAdapter
+
+        # Serialize straight to JSON in pydantic-core, without building dicts
+        # and written as is: Rich would parse markup in names and wrap lines
+        data = TypeAdapter(list[SearchResult]).dump_json(results, indent=2)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n")
+        sys.stdout.buffer.flush()
     elif output == "paths":
-        for r in results:
-            console.print(r.file_path)
+        # Plain text for piping; Rich would style and wrap each line
+        sys.stdout.write("".join(f"{r.file_path}\n" for r in results))
+        sys.stdout.flush()
     else:
         # Table output
         table = Table(show_header=True, header_style="bold")
@@ -86,11 +85,11 @@ def search(
         for r in results:
             table.add_row(
                 str(r.id),
-                r.name[:35],
+                f"{r.name:.35}",
                 r.content_type.value,
-                (r.parent_device or "")[:15],
-                (r.category or "")[:15],
-                (r.package_name or "")[:15],
+                f"{r.parent_device or '':.15}",
+                f"{r.category or '':.15}",
+                f"{r.package_name or '':.15}",
             )
 
         console.print(table)
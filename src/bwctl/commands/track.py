@@ -1,23 +1,98 @@
 """Track command for bwctl."""
 
-import time
-from typing import Optional
+import asyncio
+import re
+from enum import Enum
+from typing import Any, Callable, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
+from rich.style import Style
+from rich.text import Text
 
-from bwctl.osc.bridge import get_bridge
+from bwctl.osc.bridge import AsyncBitwigOSCBridge, get_bridge, run_async
 
-console = Console()
+# Messages are styled explicitly rather than with markup, so nothing is
+# parsed per print and track names containing "[" print as they are
+console = Console(markup=False, highlight=False)
+
+OK = Style(color="green")
+WARN = Style(color="yellow")
+ERROR = Style(color="red")
+DIM = Style(dim=True)
+VALUE = Style(color="cyan")
 
 app = typer.Typer(help="Track operations")
 
+# /track/N/property feedback from DrivenByMoss, parsed in one match rather
+# than a split per message (Bitwig sends hundreds on /refresh)
+TRACK_ADDRESS_RE = re.compile(r"/track/(\d+)(?:/([^/]+)|$)")
+
+# Per-track feedback that isn't a property of the track itself
+SKIPPED_PROPERTIES = frozenset({"clip", "send", "vu"})
+
+# /refresh replies arrive as one burst; it is over once the track feedback
+# has been quiet this long (seconds)
+QUIET_PERIOD = 0.1
+
+
+async def wait_for_burst(activity: asyncio.Event, timeout: float) -> None:
+    """Wait for a burst of OSC feedback to start and then go quiet.
+
+    Args:
+        activity: Event the OSC handler sets on every relevant message
+        timeout: Upper bound on the total wait (seconds)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    quiet = timeout  # Allow the full window for the first reply
+    while (remaining := deadline - loop.time()) > 0:
+        try:
+            await asyncio.wait_for(activity.wait(), min(quiet, remaining))
+        except TimeoutError:
+            return
+        activity.clear()
+        quiet = QUIET_PERIOD
+
+
+async def refresh(handler: Callable[..., bool], timeout: float) -> None:
+    """Send /refresh and feed Bitwig's replies to a handler until they stop.
+
+    Args:
+        handler: Called as handler(address, *args) for each message; returns
+            True if the message is part of the feedback being collected
+        timeout: Upper bound on the wait (seconds)
+    """
+    activity = asyncio.Event()
+
+    def on_message(address: str, *args: Any) -> None:
+        if handler(address, *args):
+            activity.set()
+
+    async with AsyncBitwigOSCBridge() as bridge:
+        bridge.dispatcher.set_default_handler(on_message)
+        bridge.send("/refresh")
+        await wait_for_burst(activity, timeout)
+
+
+class TrackType(str, Enum):
+    """Kinds of track Bitwig can add."""
+
+    AUDIO = "audio"
+    INSTRUMENT = "instrument"
+    EFFECT = "effect"
+
+
+def _track_list(track_numbers: list[int]) -> str:
+    """Describe track numbers for a status line, e.g. "tracks 1, 2, 3"."""
+    label = "track" if len(track_numbers) == 1 else "tracks"
+    return f"{label} {', '.join(map(str, track_numbers))}"
+
 
 @app.command()
 def add(
-    track_type: str = typer.Option(
-        "instrument", "-t", "--type", help="Track type: audio, instrument, effect"
+    track_type: TrackType = typer.Option(
+        TrackType.INSTRUMENT, "-t", "--type", case_sensitive=False, help="Track type"
     ),
     name: Optional[str] = typer.Option(None, "-n", "--name", help="Track name"),
 ) -> None:
@@ -28,19 +103,13 @@ def add(
         bwctl track add -t audio
         bwctl track add -t effect
     """
-    valid_types = ["audio", "instrument", "effect"]
-    if track_type not in valid_types:
-        console.print(f"[red]Invalid track type: {track_type}[/red]")
-        console.print(f"Valid types: {', '.join(valid_types)}")
-        raise typer.Exit(1)
-
     bridge = get_bridge()
-    bridge.add_track(track_type)
+    bridge.add_track(track_type.value)
 
-    msg = f"[green]Added {track_type} track[/green]"
+    msg = f"Added {track_type.value} track"
     if name:
         msg += f" '{name}'"
-    console.print(msg)
+    console.print(msg, style=OK)
 
 
 @app.command()
@@ -53,11 +122,11 @@ def select(
         bwctl track select 2
     """
     if track_number < 1 or track_number > 8:
-        console.print("[yellow]Note: Track bank is 1-8. Use bank navigation for more.[/yellow]")
+        console.print("Note: Track bank is 1-8. Use bank navigation for more.", style=WARN)
 
     bridge = get_bridge()
     bridge.select_track(track_number)
-    console.print(f"[green]Selected track {track_number}[/green]")
+    console.print(f"Selected track {track_number}", style=OK)
 
 
 @app.command()
@@ -71,7 +140,7 @@ def enter(
     """
     bridge = get_bridge()
     bridge.enter_group(track_number)
-    console.print(f"[green]Entered group track {track_number}[/green]")
+    console.print(f"Entered group track {track_number}", style=OK)
 
 
 @app.command()
@@ -83,12 +152,14 @@ def exit() -> None:
     """
     bridge = get_bridge()
     bridge.exit_group()
-    console.print("[green]Exited to parent[/green]")
+    console.print("Exited to parent", style=OK)
 
 
 @app.command()
 def bank(
-    direction: str = typer.Argument("show", help="Direction: next, prev, page-next, page-prev, or show"),
+    direction: str = typer.Argument(
+        "show", help="Direction: next, prev, page-next, page-prev, or show"
+    ),
 ) -> None:
     """Navigate or show track bank position.
 
@@ -102,51 +173,50 @@ def bank(
         bwctl track bank page-next # Scroll one page forward
         bwctl track bank page-prev # Scroll one page back
     """
-    from bwctl.osc.bridge import BitwigOSCBridge
-
-    bridge = BitwigOSCBridge()
+    bridge = get_bridge()
 
     if direction == "show":
-        # Query current bank position
-        track_slots = set()
-
-        def handler(addr, *args):
-            if addr.startswith("/track/"):
-                parts = addr.split("/")
-                if len(parts) >= 3 and parts[2].isdigit():
-                    track_slots.add(int(parts[2]))
-
-        bridge.dispatcher.set_default_handler(handler)
-        bridge.start_server()
-        time.sleep(0.1)
-        bridge.send("/refresh")
-        time.sleep(1.5)
-        bridge.stop_server()
+        # Query current bank position. Reported slots are kept as bits of
+        # an int, which the handler sets for every message in the burst.
+        track_slots = 0
+
+        def handler(addr: str, *args: Any) -> bool:
+            nonlocal track_slots
+            match = TRACK_ADDRESS_RE.match(addr)
+            if match and match[2] not in SKIPPED_PROPERTIES:
+                track_slots |= 1 << int(match[1])
+                return True
+            return False
+
+        run_async(refresh(handler, timeout=1.5))
 
         if track_slots:
-            slots = sorted(track_slots)
-            console.print(f"Track bank showing slots: [cyan]{min(slots)}[/cyan] - [cyan]{max(slots)}[/cyan]")
+            first = (track_slots & -track_slots).bit_length() - 1
+            last = track_slots.bit_length() - 1
+            console.print(Text.assemble(
+                "Track bank showing slots: ", (str(first), VALUE), " - ", (str(last), VALUE)
+            ))
         else:
-            console.print("[yellow]No track data received[/yellow]")
+            console.print("No track data received", style=WARN)
 
     elif direction == "next":
         bridge.scroll_track_bank(1)
-        console.print("[green]Scrolled track bank forward[/green]")
+        console.print("Scrolled track bank forward", style=OK)
 
     elif direction == "prev":
         bridge.scroll_track_bank(-1)
-        console.print("[green]Scrolled track bank back[/green]")
+        console.print("Scrolled track bank back", style=OK)
 
     elif direction == "page-next":
         bridge.scroll_track_bank_page(1)
-        console.print("[green]Scrolled track bank forward one page[/green]")
+        console.print("Scrolled track bank forward one page", style=OK)
 
     elif direction == "page-prev":
         bridge.scroll_track_bank_page(-1)
-        console.print("[green]Scrolled track bank back one page[/green]")
+        console.print("Scrolled track bank back one page", style=OK)
 
     else:
-        console.print(f"[red]Unknown direction: {direction}[/red]")
+        console.print(f"Unknown direction: {direction}", style=ERROR)
         console.print("Valid: show, next, prev, page-next, page-prev")
         raise typer.Exit(1)
 
@@ -166,9 +236,8 @@ def mute(
     bridge = get_bridge()
     action = "Unmuted" if off else "Muted"
 
-    for num in track_numbers:
-        bridge.set_track_mute(num, mute=not off)
-        console.print(f"[green]{action} track {num}[/green]")
+    bridge.set_track_states([(num, "mute", not off) for num in track_numbers])
+    console.print(f"{action} {_track_list(track_numbers)}", style=OK)
 
 
 @app.command()
@@ -185,9 +254,8 @@ def solo(
     bridge = get_bridge()
     action = "Unsoloed" if off else "Soloed"
 
-    for num in track_numbers:
-        bridge.set_track_solo(num, solo=not off)
-        console.print(f"[green]{action} track {num}[/green]")
+    bridge.set_track_states([(num, "solo", not off) for num in track_numbers])
+    console.print(f"{action} {_track_list(track_numbers)}", style=OK)
 
 
 @app.command()
@@ -204,34 +272,31 @@ def arm(
     bridge = get_bridge()
     action = "Disarmed" if off else "Armed"
 
-    for num in track_numbers:
-        bridge.set_track_arm(num, arm=not off)
-        console.print(f"[green]{action} track {num}[/green]")
+    bridge.set_track_states([(num, "arm", not off) for num in track_numbers])
+    console.print(f"{action} {_track_list(track_numbers)}", style=OK)
 
 
 @app.command()
 def volume(
     track_number: int = typer.Argument(..., help="Track number"),
-    value: float = typer.Argument(..., help="Volume (0.0 to 1.0)"),
+    value: float = typer.Argument(..., min=0.0, max=1.0, help="Volume (0.0 to 1.0)"),
 ) -> None:
     """Set track volume.
 
     Example:
         bwctl track volume 1 0.75
     """
-    if value < 0 or value > 1:
-        console.print("[red]Volume must be between 0.0 and 1.0[/red]")
-        raise typer.Exit(1)
-
     bridge = get_bridge()
     bridge.set_track_volume(track_number, value)
-    console.print(f"[green]Set track {track_number} volume to {value:.0%}[/green]")
+    console.print(f"Set track {track_number} volume to {value:.0%}", style=OK)
 
 
 @app.command()
 def pan(
     track_number: int = typer.Argument(..., help="Track number"),
-    value: float = typer.Argument(..., help="Pan (-1.0 = left, 0.0 = center, 1.0 = right)"),
+    value: float = typer.Argument(
+        ..., min=-1.0, max=1.0, help="Pan (-1.0 = left, 0.0 = center, 1.0 = right)"
+    ),
 ) -> None:
     """Set track pan.
 
@@ -240,10 +305,6 @@ def pan(
         bwctl track pan 3 -0.3   # 30% left
         bwctl track pan 8 0.2    # 20% right
     """
-    if value < -1 or value > 1:
-        console.print("[red]Pan must be between -1.0 (left) and 1.0 (right)[/red]")
-        raise typer.Exit(1)
-
     bridge = get_bridge()
     bridge.set_track_pan(track_number, value)
 
@@ -253,7 +314,7 @@ def pan(
         pos = f"{value:.0%} R"
     else:
         pos = "Center"
-    console.print(f"[green]Set track {track_number} pan to {pos}[/green]")
+    console.print(f"Set track {track_number} pan to {pos}", style=OK)
 
 
 @app.command("list")
@@ -266,35 +327,27 @@ def list_tracks() -> None:
     Examples:
         bwctl track list
     """
-    from bwctl.osc.bridge import BitwigOSCBridge
     import logging
     logger = logging.getLogger(__name__)
 
-    bridge = BitwigOSCBridge()
-    tracks = {}  # {track_num: {name, type, isGroup, ...}}
+    tracks: dict[int, dict[str, Any]] = {}  # {track_num: {name, type, isGroup, ...}}
 
-    def handle_all(address, *args):
-        logger.debug(f"OSC RECV: {address} {args}")
+    def handle_all(address: str, *args: Any) -> bool:
+        logger.debug("OSC RECV: %s %s", address, args)
         # Parse /track/N/property messages (skip clip/send data)
-        if address.startswith("/track/") and "/clip/" not in address and "/send/" not in address:
-            parts = address.split("/")
-            if len(parts) >= 4 and parts[2].isdigit():
-                track_num = int(parts[2])
-                prop = parts[3]
-                if track_num not in tracks:
-                    tracks[track_num] = {}
-                if args and args[0] not in (None, ""):
-                    tracks[track_num][prop] = args[0]
-
-    bridge.dispatcher.set_default_handler(handle_all)
-    bridge.start_server()
-    time.sleep(0.1)  # Let server start
-
-    console.print(f"[dim]Querying track bank...[/dim]")
-    bridge.send("/refresh")
-    time.sleep(2.5)  # Wait for response flood
-
-    bridge.stop_server()
+        match = TRACK_ADDRESS_RE.match(address)
+        if match and match[2] and match[2] not in SKIPPED_PROPERTIES:
+            track_num = int(match[1])
+            prop = match[2]
+            if track_num not in tracks:
+                tracks[track_num] = {}
+            if args and args[0] not in (None, ""):
+                tracks[track_num][prop] = args[0]
+            return True
+        return False
+
+    console.print("Querying track bank...", style=DIM)
+    run_async(refresh(handle_all, timeout=2.5))  # Wait for response flood
 
     # Find tracks that exist
     valid_tracks = [(num, info) for num, info in sorted(tracks.items())
@@ -302,12 +355,15 @@ def list_tracks() -> None:
 
     logger.debug(f"Valid tracks: {len(valid_tracks)}")
 
-    # Build table
-    table = Table(title="Track Bank")
-    table.add_column("Slot", style="dim", width=4)
-    table.add_column("Name", style="cyan")
-    table.add_column("Type", style="yellow")
-    table.add_column("Pos", style="dim", width=4)
+    from rich.table import Table
+
+    # Build table. Every column has a fixed width, so rich lays it out
+    # without measuring the rows first.
+    table = Table(title="Track Bank", box=None, pad_edge=False, show_edge=False)
+    table.add_column("Slot", style="dim", width=4, no_wrap=True)
+    table.add_column("Name", style="cyan", width=40, no_wrap=True)
+    table.add_column("Type", style="yellow", width=10, no_wrap=True)
+    table.add_column("Pos", style="dim", width=4, no_wrap=True)
 
     for num, info in valid_tracks:
         name = info.get("name", "")
@@ -316,5 +372,4 @@ def list_tracks() -> None:
         position = info.get("position", "?")
         table.add_row(str(num), name, track_type, str(position))
 
-    console.print(table)
-    console.print(f"\n[dim]Showing {len(valid_tracks)} tracks in current bank[/dim]")
+    console.print(table, Text(f"\nShowing {len(valid_tracks)} tracks in current bank", style=DIM))
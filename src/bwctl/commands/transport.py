@@ -44,7 +44,7 @@ def loop() -> None:
 
 @app.command()
 def tempo(
-    bpm: float = typer.Argument(..., help="Tempo in BPM (20-666)"),
+    bpm: float = typer.Argument(..., min=20.0, max=666.0, help="Tempo in BPM (20-666)"),
 ) -> None:
     """Set the tempo.
 
@@ -52,10 +52,6 @@ def tempo(
         bwctl transport tempo 120
         bwctl transport tempo 108
     """
-    if bpm < 20 or bpm > 666:
-        console.print("[red]Tempo must be between 20 and 666 BPM[/red]")
-        raise typer.Exit(1)
-
     bridge = get_bridge()
     bridge.set_tempo(bpm)
     console.print(f"[green]Tempo set to {bpm} BPM[/green]")
@@ -1,9 +1,9 @@
 """Configuration management for bwctl."""
 
+import functools
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,6 +26,17 @@ class DatabaseSettings(BaseSettings):
         """Get the database connection string."""
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    @property
+    def connect_kwargs(self) -> dict[str, Any]:
+        """Get the connection parameters as keywords, skipping DSN parsing."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "dbname": self.name,
+            "user": self.user,
+            "password": self.password,
+        }
+
 
 class OSCSettings(BaseSettings):
     """OSC bridge settings."""
@@ -33,6 +44,9 @@ class OSCSettings(BaseSettings):
     send_host: str = "127.0.0.1"
     send_port: int = 8000
     receive_port: int = 9000
+    # /refresh makes Bitwig send hundreds of messages at once, more than
+    # the default socket receive buffer holds (bytes; the OS may clamp it)
+    receive_buffer_size: int = 4 * 1024 * 1024
 
 
 class BitwigSettings(BaseSettings):
@@ -49,6 +63,7 @@ class SearchSettings(BaseSettings):
 
     default_limit: int = 20
     fuzzy_threshold: float = 0.3
+    cache_ttl: float = 300.0  # Seconds cached search results are reused for
 
 
 class Settings(BaseSettings):
@@ -65,11 +80,16 @@ class Settings(BaseSettings):
     search: SearchSettings = Field(default_factory=SearchSettings)
 
 
+@functools.cache
 def get_config_path() -> Path:
     """Get the configuration file path."""
-    config_dir = Path.home() / ".config" / "bwctl"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "config.yaml"
+    return Path.home() / ".config" / "bwctl" / "config.yaml"
+
+
+@functools.cache
+def get_cache_dir() -> Path:
+    """Get the cache directory (created by the code that writes to it)."""
+    return Path.home() / ".cache" / "bwctl"
 
 
 def load_settings() -> Settings:
@@ -77,12 +97,18 @@ def load_settings() -> Settings:
     config_path = get_config_path()
 
     if config_path.exists():
+        import yaml
+
+        # libyaml's loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(config_path) as f:
-            config_data: dict[str, Any] = yaml.safe_load(f) or {}
+            config_data: dict[str, Any] = yaml.load(f, Loader=loader) or {}
         return Settings(**config_data)
 
     return Settings()
 
 
-# Global settings instance
-settings = load_settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Get the global settings, loading them on first use."""
+    return load_settings()
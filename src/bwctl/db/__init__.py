@@ -1,11 +1,20 @@
 """Database layer for bwctl."""
 
-from bwctl.db.connection import get_connection, get_pool
+from bwctl.db.connection import (
+    get_async_connection,
+    get_async_pool,
+    get_connection,
+    get_pool,
+    warm_pool_async,
+)
 from bwctl.db.models import Content, ContentType, DeviceType, Package
 
 __all__ = [
+    "get_async_connection",
+    "get_async_pool",
     "get_connection",
     "get_pool",
+    "warm_pool_async",
     "Content",
     "ContentType",
     "DeviceType",
@@ -0,0 +1,115 @@
+"""Persistent search result cache."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from bwctl.config import get_cache_dir, get_settings
+from bwctl.db.models import ContentType, SearchResult
+from bwctl.db.search import search_content
+
+# Maximum number of cached queries (oldest are evicted first)
+SEARCH_CACHE_SIZE = 256
+
+# Cache entries by key: {"cached_at": time.time(), "results": [...]}
+SearchCache = dict[str, dict[str, Any]]
+
+
+def get_search_cache_path() -> Path:
+    """Get the search cache file path."""
+    return get_cache_dir() / "search.json"
+
+
+def _load() -> SearchCache:
+    path = get_search_cache_path()
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            data: SearchCache = json.load(f)
+            return data
+    except (OSError, ValueError):
+        # A corrupt cache is just a cold cache
+        return {}
+
+
+def _save(cache: SearchCache) -> None:
+    path = get_search_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+    tmp_path.replace(path)
+
+
+def cached_search(
+    query: str,
+    content_type: ContentType | None = None,
+    parent_device: str | None = None,
+    category: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[SearchResult]:
+    """Search for content, reusing results from earlier invocations.
+
+    Results are cached on disk by query and filters so repeated lookups
+    from the shell or scripts skip the database. Database search is case
+    insensitive, so queries are normalized before lookup. The cache is
+    cleared whenever the index is rebuilt, and entries older than the
+    search.cache_ttl setting are ignored, so changes to the database made
+    any other way are picked up too.
+
+    Args:
+        query: Search query
+        content_type: Filter by content type
+        parent_device: Filter by parent device name (partial match)
+        category: Filter by category (partial match)
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        List of search results sorted by relevance
+    """
+    query = query.strip().lower()
+    key = json.dumps([
+        query,
+        content_type.value if content_type else None,
+        parent_device,
+        category,
+        limit,
+        offset,
+    ])
+    cache = _load()
+    now = time.time()
+    oldest = now - get_settings().search.cache_ttl
+
+    entry = cache.get(key)
+    if isinstance(entry, dict) and entry.get("cached_at", 0) > oldest:
+        return [SearchResult(**row) for row in entry["results"]]
+
+    results = search_content(
+        query=query,
+        content_type=content_type,
+        parent_device=parent_device,
+        category=category,
+        limit=limit,
+        offset=offset,
+    )
+
+    # Drop expired entries (and any in an older format) while writing
+    cache = {
+        k: v for k, v in cache.items()
+        if k != key and isinstance(v, dict) and v.get("cached_at", 0) > oldest
+    }
+    cache[key] = {"cached_at": now, "results": [r.model_dump(mode="json") for r in results]}
+    while len(cache) > SEARCH_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    _save(cache)
+
+    return results
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results."""
+    get_search_cache_path().unlink(missing_ok=True)
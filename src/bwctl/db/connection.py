@@ -1,33 +1,83 @@
 """Database connection management."""
 
-from contextlib import contextmanager
-from typing import Generator
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 
-import psycopg
-from psycopg.rows import dict_row
-from psycopg_pool import ConnectionPool
+from bwctl.config import get_settings
 
-from bwctl.config import settings
+# psycopg is imported on first connection, so commands that only import the
+# database layer for its models (or never reach the database) skip it
+if TYPE_CHECKING:
+    import psycopg
+    from psycopg.rows import DictRow
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
-_pool: ConnectionPool | None = None
+_pool: "ConnectionPool[psycopg.Connection[DictRow]] | None" = None
+_async_pool: "AsyncConnectionPool[psycopg.AsyncConnection[DictRow]] | None" = None
+_pool_lock = threading.Lock()
 
 
-def get_pool() -> ConnectionPool:
+def get_pool() -> "ConnectionPool[psycopg.Connection[DictRow]]":
     """Get or create the connection pool."""
     global _pool
-    if _pool is None:
-        _pool = ConnectionPool(
-            settings.database.dsn,
-            min_size=1,
-            max_size=10,
-            kwargs={"row_factory": dict_row},
-        )
+    with _pool_lock:
+        if _pool is None:
+            import psycopg
+            from psycopg.rows import DictRow, dict_row
+            from psycopg_pool import ConnectionPool
+
+            # The pool's connections return rows as dicts
+            _pool = ConnectionPool[psycopg.Connection[DictRow]](
+                min_size=1,
+                max_size=10,
+                kwargs={**get_settings().database.connect_kwargs, "row_factory": dict_row},
+            )
     return _pool
 
 
+def warm_pool_async() -> None:
+    """Start creating the connection pool in the background.
+
+    Commands that are certain to reach the database call this first, so the
+    connection is set up while they do their other work.
+    """
+    threading.Thread(target=get_pool, name="bwctl-db-warm", daemon=True).start()
+
+
 @contextmanager
-def get_connection() -> Generator[psycopg.Connection, None, None]:
+def get_connection() -> Generator["psycopg.Connection[DictRow]", None, None]:
     """Get a database connection from the pool."""
     pool = get_pool()
     with pool.connection() as conn:
         yield conn
+
+
+async def get_async_pool() -> "AsyncConnectionPool[psycopg.AsyncConnection[DictRow]]":
+    """Get or create the async connection pool, for use from asyncio code.
+
+    The pool is opened on first use and then shared for the rest of the
+    process, so an async session connects once.
+    """
+    global _async_pool
+    if _async_pool is None:
+        import psycopg
+        from psycopg.rows import DictRow, dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        _async_pool = AsyncConnectionPool[psycopg.AsyncConnection[DictRow]](
+            min_size=1,
+            max_size=10,
+            kwargs={**get_settings().database.connect_kwargs, "row_factory": dict_row},
+            open=False,
+        )
+        await _async_pool.open()
+    return _async_pool
+
+
+@asynccontextmanager
+async def get_async_connection() -> AsyncGenerator["psycopg.AsyncConnection[DictRow]", None]:
+    """Get an async database connection from the pool."""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        yield conn
@@ -1,19 +1,22 @@
 """Content indexer for Bitwig Studio files."""
 
+import functools
 import hashlib
+import mmap
 import os
 import re
-import wave
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterable, Iterator, NamedTuple
 
 from rich.progress import Progress, TaskID
 
-from bwctl.config import settings
+from bwctl.config import get_settings
+from bwctl.db.cache import clear_search_cache
 from bwctl.db.connection import get_connection
-from bwctl.db.models import Content, ContentType, DeviceType, Package
+from bwctl.db.models import ContentType, DeviceType, Package
 
 # File extension to content type mapping
 EXTENSION_MAP: dict[str, ContentType] = {
@@ -33,9 +36,32 @@ EXTENSION_MAP: dict[str, ContentType] = {
     ".bwproject": ContentType.PROJECT,
 }
 
+# The same extensions without the dot, for matching names while scanning
+CONTENT_EXTENSIONS = frozenset(ext[1:] for ext in EXTENSION_MAP)
+
+# Files sent to each worker process at a time when parsing
+PARSE_CHUNKSIZE = 64
+
+# Content rows written per transaction when indexing
+CONTENT_BATCH_SIZE = 1000
+
+# WAV (RIFF) chunk header and the start of the fmt chunk: format, channels,
+# sample rate, byte rate, block align
+WAV_CHUNK_HEADER = struct.Struct("<4sI")
+WAV_FMT = struct.Struct("<HHIIH")
+
+# Path component that device presets are filed under
+PRESETS_DIR = f"{os.sep}Presets{os.sep}"
+
+# Files up to this size are hashed from a memory map in one call
+MMAP_HASH_LIMIT = 256 * 1024 * 1024
+
 # Device name to type mapping (common patterns)
 DEVICE_TYPE_PATTERNS: dict[str, DeviceType] = {
-    r"(?i)(polymer|phase-4|fm-4|polysynth|sampler|organ|piano|synth|instrument)": DeviceType.INSTRUMENT,
+    (
+        r"(?i)(polymer|phase-4|fm-4|polysynth|sampler|organ|piano|synth"
+        r"|instrument)"
+    ): DeviceType.INSTRUMENT,
     r"(?i)(eq|filter|comp|reverb|delay|chorus|flanger|phaser|distort|amp|fx)": DeviceType.AUDIO_FX,
     r"(?i)(arpeggiator|note|chord|scale|transpose|velocity|midi)": DeviceType.NOTE_FX,
     r"(?i)(lfo|adsr|envelope|steps|curve|macro|modulator)": DeviceType.MODULATOR,
@@ -43,6 +69,50 @@ DEVICE_TYPE_PATTERNS: dict[str, DeviceType] = {
     r"(?i)(meter|tool|utility|audio receiver|note receiver)": DeviceType.UTILITY,
 }
 
+# Compiled once for the indexer's per-file loop. The device patterns stay
+# separate and in order, as the first pattern to match decides the type.
+DEVICE_TYPE_RES = [(re.compile(p), t) for p, t in DEVICE_TYPE_PATTERNS.items()]
+
+# Preset name conventions
+BRACKET_CATEGORY_RE = re.compile(r"\[([^\]]+)\]\s*(.+)")
+TAG_RE = re.compile(
+    r"\b(analog|digital|fm|wavetable|sample|granular"
+    r"|warm|cold|dark|bright|soft|hard|aggressive"
+    r"|ambient|cinematic|vintage|modern|classic"
+    r"|bass|lead|pad|pluck|keys|strings|brass|perc)\b",
+    re.IGNORECASE,
+)
+
+
+class ContentRow(NamedTuple):
+    """A content row as the indexer writes it, in CONTENT_COLUMNS order.
+
+    Used instead of Content on the indexing path: it needs no validation,
+    pickles cheaply and goes to the database as is.
+    """
+
+    name: str
+    file_path: str
+    content_type: str
+    package_id: int | None = None
+    parent_device: str | None = None
+    description: str | None = None
+    category: str | None = None
+    subcategory: str | None = None
+    tags: tuple[str, ...] = ()
+    creator: str | None = None
+    device_type: str | None = None
+    device_uuid: str | None = None
+    plugin_id: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+    duration_ms: int | None = None
+    bpm: float | None = None
+    key_signature: str | None = None
+    file_size: int | None = None
+    file_hash: str | None = None
+    modified_at: datetime | None = None
+
 
 def get_content_type(path: Path) -> ContentType | None:
     """Get the content type for a file."""
@@ -50,34 +120,58 @@ def get_content_type(path: Path) -> ContentType | None:
     return EXTENSION_MAP.get(ext)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_device_type(device_name: str) -> DeviceType | None:
-    """Infer device type from device name."""
-    for pattern, device_type in DEVICE_TYPE_PATTERNS.items():
-        if re.search(pattern, device_name):
+    """Infer device type from device name.
+
+    Cached, as every preset for a device asks about the same name.
+    """
+    for pattern, device_type in DEVICE_TYPE_RES:
+        if pattern.search(device_name):
             return device_type
     return None
 
 
 def compute_file_hash(path: Path) -> str:
     """Compute SHA-256 hash of a file."""
-    hasher = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= MMAP_HASH_LIMIT:  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def get_wav_info(path: Path) -> dict:
-    """Get audio info from a WAV file."""
+    """Get audio info from a WAV file.
+
+    Only the chunk headers are read, skipping over everything up to the
+    fmt and data chunks.
+    """
     try:
-        with wave.open(str(path), "rb") as wav:
-            return {
-                "sample_rate": wav.getframerate(),
-                "channels": wav.getnchannels(),
-                "duration_ms": int(wav.getnframes() / wav.getframerate() * 1000),
-            }
+        with open(path, "rb") as f:
+            riff = f.read(12)
+            if riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+                return {}
+            fmt = None
+            while header := f.read(WAV_CHUNK_HEADER.size):
+                chunk_id, size = WAV_CHUNK_HEADER.unpack(header)
+                if chunk_id == b"fmt ":
+                    if size < WAV_FMT.size:
+                        return {}  # Truncated fmt chunk; nothing after it can be trusted
+                    fmt = WAV_FMT.unpack(f.read(WAV_FMT.size))
+                    size -= WAV_FMT.size
+                elif chunk_id == b"data" and fmt:
+                    _, channels, sample_rate, _, block_align = fmt
+                    return {
+                        "sample_rate": sample_rate,
+                        "channels": channels,
+                        "duration_ms": int(size // block_align / sample_rate * 1000),
+                    }
+                f.seek(size + (size & 1), os.SEEK_CUR)  # Chunks are word-aligned
     except Exception:
-        return {}
+        pass
+    return {}
 
 
 def parse_preset_name(name: str) -> dict:
@@ -98,22 +192,13 @@ def parse_preset_name(name: str) -> dict:
         name = parts[1].strip()
 
     # Pattern: "[Category] Name"
-    bracket_match = re.match(r"\[([^\]]+)\]\s*(.+)", name)
+    bracket_match = BRACKET_CATEGORY_RE.match(name)
     if bracket_match:
         result["category"] = bracket_match.group(1)
         name = bracket_match.group(2)
 
-    # Extract tags from common keywords in name
-    tag_patterns = [
-        r"(?i)\b(analog|digital|fm|wavetable|sample|granular)\b",
-        r"(?i)\b(warm|cold|dark|bright|soft|hard|aggressive)\b",
-        r"(?i)\b(ambient|cinematic|vintage|modern|classic)\b",
-        r"(?i)\b(bass|lead|pad|pluck|keys|strings|brass|perc)\b",
-    ]
-
-    for pattern in tag_patterns:
-        matches = re.findall(pattern, name)
-        result["tags"].extend([m.lower() for m in matches])
+    # Extract tags from common keywords in name, in one scan
+    result["tags"] = [m.lower() for m in TAG_RE.findall(name)]
 
     return result
 
@@ -154,19 +239,46 @@ def discover_packages(base_path: Path) -> list[dict]:
 
 
 def discover_content(package_path: Path) -> Iterator[Path]:
-    """Discover all content files in a package directory."""
-    for ext in EXTENSION_MAP:
-        yield from package_path.rglob(f"*{ext}")
+    """Discover all content files in a package directory.
 
-
-def index_file(path: Path, package_id: int | None = None) -> Content | None:
-    """Index a single file and return a Content object."""
+    The tree is walked once, matching every content extension (in any case)
+    as it goes. Symlinked directories are not followed.
+    """
+    pending = [package_path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                    continue
+                _, dot, ext = entry.name.rpartition(".")
+                if dot and ext.lower() in CONTENT_EXTENSIONS:
+                    yield Path(entry.path)
+
+
+def index_file(
+    path: Path,
+    package_id: int | None = None,
+    compute_hash: bool = False,
+    stat: os.stat_result | None = None,
+) -> ContentRow | None:
+    """Index a single file and return its content row.
+
+    Samples are only hashed (reading the whole file) when compute_hash is
+    set; other content is never hashed. The file is only stat()ed if its
+    stat result isn't passed in.
+    """
     content_type = get_content_type(path)
     if content_type is None:
         return None
 
     name = path.stem
-    stat = path.stat()
+    if stat is None:
+        stat = path.stat()
 
     # Parse metadata from name/path
     parsed = parse_preset_name(name)
@@ -174,11 +286,13 @@ def index_file(path: Path, package_id: int | None = None) -> Content | None:
     # Infer parent device from path
     # Pattern: .../Presets/DeviceName/preset.bwpreset
     parent_device = None
-    parts = path.parts
-    if "Presets" in parts:
-        preset_idx = parts.index("Presets")
-        if preset_idx + 1 < len(parts) - 1:
-            parent_device = parts[preset_idx + 1]
+    path_str = str(path)
+    presets_idx = path_str.find(PRESETS_DIR)
+    if presets_idx >= 0:
+        device_start = presets_idx + len(PRESETS_DIR)
+        device_end = path_str.find(os.sep, device_start)
+        if device_end >= 0:
+            parent_device = path_str[device_start:device_end]
 
     # Infer category from path if not parsed from name
     category = parsed.get("category")
@@ -196,121 +310,176 @@ def index_file(path: Path, package_id: int | None = None) -> Content | None:
     if content_type == ContentType.SAMPLE and path.suffix.lower() == ".wav":
         audio_props = get_wav_info(path)
 
-    return Content(
+    file_hash = None
+    if compute_hash and content_type == ContentType.SAMPLE:
+        file_hash = compute_file_hash(path)
+
+    return ContentRow(
         name=name,
-        file_path=str(path),
-        content_type=content_type,
+        file_path=path_str,
+        content_type=content_type.value,
         package_id=package_id,
         parent_device=parent_device,
         category=category,
-        tags=parsed.get("tags", []),
-        device_type=device_type,
+        tags=tuple(parsed["tags"]),
+        device_type=device_type.value if device_type else None,
         file_size=stat.st_size,
+        file_hash=file_hash,
         modified_at=datetime.fromtimestamp(stat.st_mtime),
         **audio_props,
     )
 
 
-def save_package(package: dict) -> int:
-    """Save a package to the database and return its ID."""
+def _parse_file(
+    args: tuple[Path, int | None, os.stat_result | None], compute_hash: bool = False
+) -> ContentRow | None:
+    """Worker process entry point: index a file, or None if it can't be."""
+    file_path, pkg_id, stat = args
+    try:
+        return index_file(file_path, pkg_id, compute_hash, stat)
+    except Exception:
+        return None
+
+
+# (file_size, modified_at, file_hash) of indexed files, by path
+IndexedFiles = dict[str, tuple[int | None, datetime | None, str | None]]
+
+
+def load_indexed_files() -> IndexedFiles:
+    """Get (file_size, modified_at, file_hash) of every indexed file by path."""
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT file_path, file_size, modified_at, file_hash FROM content")
+            return {
+                row["file_path"]: (row["file_size"], row["modified_at"], row["file_hash"])
+                for row in cur
+            }
+
+
+def _is_unchanged(
+    path: Path, stat: os.stat_result, indexed: IndexedFiles, dedup: bool = False
+) -> bool:
+    """Check if a file is indexed with its current size and modification time."""
+    row = indexed.get(str(path))
+    if row is None:
+        return False
+    file_size, modified_at, file_hash = row
+    if dedup and file_hash is None and get_content_type(path) == ContentType.SAMPLE:
+        return False  # Indexed before hashing was asked for
+    return file_size == stat.st_size and modified_at == datetime.fromtimestamp(stat.st_mtime)
+
+
+PACKAGE_UPSERT = """
+    INSERT INTO packages (name, vendor, version, path, is_factory)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (path) DO UPDATE SET
+        name = EXCLUDED.name,
+        vendor = EXCLUDED.vendor,
+        version = EXCLUDED.version,
+        is_factory = EXCLUDED.is_factory
+    RETURNING id
+"""
+
+
+def _package_params(package: dict[str, Any]) -> tuple[Any, ...]:
+    """Get the PACKAGE_UPSERT parameters for a discovered package."""
+    return (
+        package["name"],
+        package["vendor"],
+        package.get("version"),
+        package["path"],
+        package.get("is_factory", False),
+    )
+
+
+def save_packages(packages: list[dict[str, Any]]) -> dict[str, int]:
+    """Save packages in one transaction and return their IDs by path."""
+    if not packages:
+        return {}
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO packages (name, vendor, version, path, is_factory)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (path) DO UPDATE SET
-                    name = EXCLUDED.name,
-                    vendor = EXCLUDED.vendor,
-                    version = EXCLUDED.version,
-                    is_factory = EXCLUDED.is_factory
-                RETURNING id
-                """,
-                (
-                    package["name"],
-                    package["vendor"],
-                    package.get("version"),
-                    package["path"],
-                    package.get("is_factory", False),
-                ),
+            cur.executemany(
+                PACKAGE_UPSERT, [_package_params(pkg) for pkg in packages], returning=True
             )
-            result = cur.fetchone()
+            package_ids = {}
+            for pkg in packages:
+                result = cur.fetchone()
+                assert result is not None  # One RETURNING row per package
+                package_ids[pkg["path"]] = result["id"]
+                cur.nextset()
             conn.commit()
-            return result["id"]
-
-
-def save_content(content: Content) -> int | None:
-    """Save content to the database and return its ID."""
+            return package_ids
+
+
+# Content columns written by the indexer, in ContentRow order
+CONTENT_COLUMNS = """
+    name, file_path, content_type, package_id, parent_device,
+    description, category, subcategory, tags, creator,
+    device_type, device_uuid, plugin_id,
+    sample_rate, channels, duration_ms, bpm, key_signature,
+    file_size, file_hash, modified_at
+"""
+
+CONTENT_CONFLICT = """
+    ON CONFLICT (file_path) DO UPDATE SET
+        name = EXCLUDED.name,
+        content_type = EXCLUDED.content_type,
+        package_id = EXCLUDED.package_id,
+        parent_device = EXCLUDED.parent_device,
+        category = EXCLUDED.category,
+        tags = EXCLUDED.tags,
+        device_type = EXCLUDED.device_type,
+        file_size = EXCLUDED.file_size,
+        file_hash = EXCLUDED.file_hash,
+        modified_at = EXCLUDED.modified_at,
+        indexed_at = NOW()
+"""
+
+def copy_contents(rows: Iterable[ContentRow]) -> int:
+    """Bulk-load content rows with COPY and return the number of rows saved.
+
+    Rows are streamed into a temporary staging table and then upserted
+    into content in one statement, keeping one row per file path.
+    """
     with get_connection() as conn:
         with conn.cursor() as cur:
             try:
                 cur.execute(
+                    f"""
+                    CREATE TEMP TABLE content_staging ON COMMIT DROP AS
+                    SELECT {CONTENT_COLUMNS} FROM content WITH NO DATA
                     """
-                    INSERT INTO content (
-                        name, file_path, content_type, package_id, parent_device,
-                        description, category, subcategory, tags, creator,
-                        device_type, device_uuid, plugin_id,
-                        sample_rate, channels, duration_ms, bpm, key_signature,
-                        file_size, file_hash, modified_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s,
-                        %s, %s, %s,
-                        %s, %s, %s, %s, %s,
-                        %s, %s, %s
-                    )
-                    ON CONFLICT (file_path) DO UPDATE SET
-                        name = EXCLUDED.name,
-                        content_type = EXCLUDED.content_type,
-                        package_id = EXCLUDED.package_id,
-                        parent_device = EXCLUDED.parent_device,
-                        category = EXCLUDED.category,
-                        tags = EXCLUDED.tags,
-                        device_type = EXCLUDED.device_type,
-                        file_size = EXCLUDED.file_size,
-                        modified_at = EXCLUDED.modified_at,
-                        indexed_at = NOW()
-                    RETURNING id
-                    """,
-                    (
-                        content.name,
-                        content.file_path,
-                        content.content_type.value,
-                        content.package_id,
-                        content.parent_device,
-                        content.description,
-                        content.category,
-                        content.subcategory,
-                        content.tags or [],
-                        content.creator,
-                        content.device_type.value if content.device_type else None,
-                        str(content.device_uuid) if content.device_uuid else None,
-                        content.plugin_id,
-                        content.sample_rate,
-                        content.channels,
-                        content.duration_ms,
-                        content.bpm,
-                        content.key_signature,
-                        content.file_size,
-                        content.file_hash,
-                        content.modified_at,
-                    ),
                 )
-                result = cur.fetchone()
+                with cur.copy(f"COPY content_staging ({CONTENT_COLUMNS}) FROM STDIN") as copy:
+                    for row in rows:
+                        # Tuples dump as composites; tags is a text[] column
+                        copy.write_row(row._replace(tags=list(row.tags)))
+                cur.execute(
+                    f"""
+                    INSERT INTO content ({CONTENT_COLUMNS})
+                    SELECT DISTINCT ON (file_path) {CONTENT_COLUMNS} FROM content_staging
+                    {CONTENT_CONFLICT}
+                    """
+                )
+                count = cur.rowcount
                 conn.commit()
-                return result["id"] if result else None
+                return count
             except Exception as e:
                 conn.rollback()
                 raise e
 
 
 def clear_index() -> int:
-    """Clear all indexed content. Returns number of rows deleted."""
+    """Clear all indexed content. Returns number of content rows deleted."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM content")
-            cur.execute("DELETE FROM packages")
-            count = cur.rowcount
+            cur.execute("SELECT count(*) AS count FROM content")
+            result = cur.fetchone()
+            assert result is not None  # count(*) always yields a row
+            count: int = result["count"]
+            # CASCADE also empties the tables referencing content, as
+            # DELETE did through their ON DELETE CASCADE keys
+            cur.execute("TRUNCATE content, packages RESTART IDENTITY CASCADE")
             conn.commit()
             return count
 
@@ -320,25 +489,33 @@ def run_indexer(
     full: bool = False,
     workers: int = 4,
     progress: Progress | None = None,
+    dedup: bool = False,
 ) -> dict[str, int]:
     """Run the content indexer.
 
+    Files already indexed with the same size and modification time are
+    skipped unless full is set.
+
     Args:
         paths: Paths to index (defaults to configured paths)
         full: If True, clear existing index first
         workers: Number of parallel workers
         progress: Rich progress bar to update
+        dedup: If True, hash samples so duplicates can be found
 
     Returns:
         Dictionary with indexing statistics
     """
     if paths is None:
-        paths = settings.bitwig.content_paths
+        paths = get_settings().bitwig.content_paths
 
-    stats = {"packages": 0, "files": 0, "errors": 0}
+    stats = {"packages": 0, "files": 0, "skipped": 0, "errors": 0}
 
     if full:
         clear_index()
+        indexed = {}
+    else:
+        indexed = load_indexed_files()
 
     # Discover and index packages
     all_packages = []
@@ -349,51 +526,91 @@ def run_indexer(
             all_packages.extend(packages)
 
     # Save packages first
-    package_ids = {}
-    for pkg in all_packages:
-        pkg_id = save_package(pkg)
-        package_ids[pkg["path"]] = pkg_id
-        stats["packages"] += 1
-
-    # Collect all files to index
-    files_to_index: list[tuple[Path, int | None]] = []
-    for pkg in all_packages:
-        pkg_path = Path(pkg["path"])
-        pkg_id = package_ids[pkg["path"]]
-        for file_path in discover_content(pkg_path):
-            files_to_index.append((file_path, pkg_id))
-
-    # Also index user library (not in packages)
+    package_ids = save_packages(all_packages)
+    stats["packages"] = len(all_packages)
+
+    # Collect all files to index: every package, plus the user library
+    # (not in packages). The trees are walked on parallel threads, as
+    # scanning directories mostly waits on the filesystem.
+    roots: list[tuple[Path, int | None]] = [
+        (Path(pkg["path"]), package_ids[pkg["path"]]) for pkg in all_packages
+    ]
     for path_str in paths:
         path = Path(path_str).expanduser()
         if path.exists() and "installed-packages" not in str(path):
-            for file_path in discover_content(path):
-                files_to_index.append((file_path, None))
+            roots.append((path, None))
+
+    files_to_index: list[tuple[Path, int | None, os.stat_result | None]] = []
+    with ThreadPoolExecutor(max_workers=workers) as walkers:
+        found = walkers.map(lambda root: list(discover_content(root[0])), roots)
+        for (_, pkg_id), file_paths in zip(roots, found):
+            files_to_index.extend((file_path, pkg_id, None) for file_path in file_paths)
+
+    if indexed:
+        # The stat results are passed on to the parsers, so changed files
+        # are only stat()ed once
+        changed = []
+        for file_path, pkg_id, _ in files_to_index:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                stat = None  # Left for the parser to report
+            if stat is None or not _is_unchanged(file_path, stat, indexed, dedup):
+                changed.append((file_path, pkg_id, stat))
+        stats["skipped"] = len(files_to_index) - len(changed)
+        files_to_index = changed
 
     # Index files in parallel
     task_id: TaskID | None = None
     if progress:
         task_id = progress.add_task("Indexing files...", total=len(files_to_index))
 
-    def index_one(args: tuple[Path, int | None]) -> bool:
-        file_path, pkg_id = args
-        try:
-            content = index_file(file_path, pkg_id)
-            if content:
-                save_content(content)
-                return True
-        except Exception:
-            return False
-        return False
+    def advance(count: int = 1) -> None:
+        if progress and task_id is not None:
+            progress.advance(task_id, count)
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [executor.submit(index_one, args) for args in files_to_index]
-        for future in as_completed(futures):
-            if future.result():
-                stats["files"] += 1
-            else:
-                stats["errors"] += 1
-            if progress and task_id is not None:
-                progress.advance(task_id)
+    # Parsing is CPU-bound, so it runs in worker processes
+    with ProcessPoolExecutor(max_workers=workers) as parsers:
+        parse = functools.partial(_parse_file, compute_hash=dedup)
+        parsed = parsers.map(parse, files_to_index, chunksize=PARSE_CHUNKSIZE)
+
+        def valid_rows() -> Iterator[ContentRow]:
+            for row in parsed:
+                if row is None:
+                    stats["errors"] += 1
+                    advance()
+                    continue
+                yield row
+                if full:
+                    advance()  # Batched writes advance once saved instead
+
+        if full:
+            # The table was just emptied, so everything is streamed in
+            # through a single COPY as it is parsed
+            stats["files"] = copy_contents(valid_rows())
+        else:
+            # Writes are I/O-bound and run on threads in this process, each
+            # batch of rows copied in and merged in its own transaction
+            with ThreadPoolExecutor(max_workers=workers) as writers:
+                futures = {}  # Future -> batch size
+                batch: list[ContentRow] = []
+                for row in valid_rows():
+                    batch.append(row)
+                    if len(batch) >= CONTENT_BATCH_SIZE:
+                        futures[writers.submit(copy_contents, batch)] = len(batch)
+                        batch = []
+                if batch:
+                    futures[writers.submit(copy_contents, batch)] = len(batch)
+
+                for future in as_completed(futures):
+                    count = futures[future]
+                    if future.exception() is None:
+                        stats["files"] += future.result()
+                    else:
+                        stats["errors"] += count
+                    advance(count)
+
+    # Cached search results may now be stale
+    clear_search_cache()
 
     return stats
@@ -1,16 +1,116 @@
 """OSC bridge for communicating with Bitwig via DrivenByMoss."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Callable
+import socket
+import struct
 import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    TypeVar,
+    cast,
+)
 
-from pythonosc import udp_client
+from pythonosc.dispatcher import Dispatcher
+from pythonosc.osc_bundle_builder import IMMEDIATELY
+from pythonosc.osc_message_builder import build_msg
+from pythonosc.parsing import osc_types
+
+from bwctl.config import get_settings
+
+if TYPE_CHECKING:
+    from pythonosc.osc_server import BlockingOSCUDPServer
 
 logger = logging.getLogger(__name__)
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import ThreadingOSCUDPServer
 
-from bwctl.config import settings
+T = TypeVar("T")
+
+INT32 = struct.Struct(">i")
+INT32_RANGE = range(-(2**31), 2**31)
+FLOAT32 = struct.Struct(">f")
+
+
+@functools.lru_cache(maxsize=2048)
+def _message_prefix(address: str, type_tags: str) -> bytes:
+    """Encode an OSC address and type tag string."""
+    return osc_types.write_string(address) + osc_types.write_string("," + type_tags)
+
+
+def encode_message(address: str, args: tuple[Any, ...]) -> bytes:
+    """Encode an OSC message.
+
+    Nearly every message to Bitwig has no arguments or a single int, float
+    or string. Those are appended to a cached address and type tag prefix
+    instead of going through pythonosc's message builder, which handles
+    everything else.
+    """
+    if not args:
+        return _message_prefix(address, "")
+    if len(args) == 1:
+        arg = args[0]
+        arg_type = type(arg)  # Exact types: bool is not an int here
+        if arg_type is int and arg in INT32_RANGE:
+            return _message_prefix(address, "i") + INT32.pack(arg)
+        if arg_type is float:
+            return _message_prefix(address, "f") + FLOAT32.pack(arg)
+        if arg_type is str:
+            return _message_prefix(address, "s") + osc_types.write_string(arg)
+    return build_msg(address, args).dgram
+
+
+def encode_bundle(timestamp: float, contents: list[bytes]) -> bytes:
+    """Encode an OSC bundle of already encoded messages or bundles."""
+    parts = [b"#bundle\x00", osc_types.write_date(timestamp)]
+    for content in contents:
+        parts.append(INT32.pack(len(content)))
+        parts.append(content)
+    return b"".join(parts)
+
+
+def _grow_receive_buffer(sock: socket.socket) -> None:
+    """Enlarge a socket's receive buffer to the configured size."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, get_settings().osc.receive_buffer_size)
+    # The kernel may clamp the size (net.core.rmem_max on Linux)
+    logger.debug(
+        "OSC receive buffer: %d bytes", sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    )
+
+
+class ExpectedReply(threading.Event):
+    """Event set when Bitwig next sends to an address (see BitwigOSCBridge.expect).
+
+    A wait that times out unregisters the event from the bridge, so replies
+    that never come don't accumulate. Call cancel() to give up without
+    waiting.
+    """
+
+    def __init__(self, bridge: "BitwigOSCBridge", address: str):
+        super().__init__()
+        self._bridge = bridge
+        self._address = address
+
+    def __call__(self, *args: Any) -> None:
+        self.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the reply; True if it arrived within the timeout."""
+        if super().wait(timeout):
+            return True
+        self.cancel()
+        return self.is_set()  # It may have arrived just before cancelling
+
+    def cancel(self) -> None:
+        """Stop listening for the reply."""
+        self._bridge._forget(self._address, self)
 
 
 class BitwigOSCBridge:
@@ -33,39 +133,101 @@ class BitwigOSCBridge:
             send_port: Port to send OSC messages to
             receive_port: Port to receive OSC messages on
         """
-        self.send_host = send_host or settings.osc.send_host
-        self.send_port = send_port or settings.osc.send_port
-        self.receive_port = receive_port or settings.osc.receive_port
-
-        self.client = udp_client.SimpleUDPClient(self.send_host, self.send_port)
+        osc_settings = get_settings().osc
+        self.send_host = send_host or osc_settings.send_host
+        self.send_port = send_port or osc_settings.send_port
+        self.receive_port = receive_port or osc_settings.receive_port
+
+        # One UDP socket for the bridge's lifetime. Connecting it resolves the
+        # destination once instead of on every send.
+        family, _, _, _, address = socket.getaddrinfo(
+            self.send_host, self.send_port, type=socket.SOCK_DGRAM
+        )[0]
+        self._sock = socket.socket(family, socket.SOCK_DGRAM)
+        self._sock.connect(address)
         self.dispatcher = Dispatcher()
-        self.server: ThreadingOSCUDPServer | None = None
+        self.dispatcher.set_default_handler(self._handle_message)
+        # Only commands that need replies start a server (see start_server)
+        self.server: "BlockingOSCUDPServer | None" = None
         self._server_thread: threading.Thread | None = None
 
         # State tracking
         self._state: dict[str, Any] = {}
         self._callbacks: dict[str, list[Callable]] = {}
+        self._callbacks_lock = threading.Lock()
+
+        # Contents of the open bundles (innermost last); sends are buffered
+        # while non-empty
+        self._bundles: list[list[bytes]] = []
+
+        # Parameters held touched by touch()
+        self._touched: set[str] = set()
 
     def start_server(self) -> None:
-        """Start the OSC server to receive messages from Bitwig."""
+        """Start the OSC server to receive messages from Bitwig.
+
+        The receive socket is bound by the time this returns, so replies to
+        anything sent afterwards are buffered even before the server thread
+        is scheduled; there is no need to wait before sending. Messages are
+        handled in order on that one thread.
+        """
         if self.server is not None:
             return
 
-        self.server = ThreadingOSCUDPServer(
+        from pythonosc.osc_server import BlockingOSCUDPServer
+
+        self.server = BlockingOSCUDPServer(
             ("0.0.0.0", self.receive_port),
             self.dispatcher,
         )
+        _grow_receive_buffer(self.server.socket)
         self._server_thread = threading.Thread(target=self.server.serve_forever)
         self._server_thread.daemon = True
         self._server_thread.start()
 
     def stop_server(self) -> None:
-        """Stop the OSC server."""
+        """Stop the OSC server and release its port."""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             self._server_thread = None
 
+    def _handle_message(self, address: str, *args: Any) -> None:
+        """Default dispatcher handler: fire one-shot callbacks for address."""
+        logger.debug("OSC RECV: %s %s", address, args)
+        with self._callbacks_lock:
+            callbacks = self._callbacks.pop(address, [])
+        for callback in callbacks:
+            callback(*args)
+
+    def expect(self, address: str) -> ExpectedReply:
+        """Get an event that is set when Bitwig next sends to an address.
+
+        Call this before sending the command that triggers the reply, so
+        the reply cannot be missed. Requires the OSC server to be running
+        (see start_server).
+
+        Args:
+            address: OSC address to wait for (e.g., "/track/1/clip/1/hasContent")
+
+        Returns:
+            Event that is set when the message arrives
+        """
+        event = ExpectedReply(self, address)
+        with self._callbacks_lock:
+            self._callbacks.setdefault(address, []).append(event)
+        return event
+
+    def _forget(self, address: str, callback: Callable[..., None]) -> None:
+        """Unregister a one-shot callback that is no longer wanted."""
+        with self._callbacks_lock:
+            callbacks = self._callbacks.get(address, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._callbacks.pop(address, None)
+
     def send(self, address: str, *args: Any) -> None:
         """Send an OSC message.
 
@@ -73,8 +235,91 @@ class BitwigOSCBridge:
             address: OSC address path (e.g., "/track/1/select")
             *args: Message arguments
         """
-        logger.debug(f"OSC SEND: {address} {list(args)}")
-        self.client.send_message(address, list(args))
+        logger.debug("OSC SEND: %s %s", address, args)
+        dgram = encode_message(address, args)
+        if self._bundles:
+            self._bundles[-1].append(dgram)
+        else:
+            self._send_dgram(dgram)
+
+    @contextmanager
+    def bundle(self, dt: float = 0.0) -> Iterator[None]:
+        """Buffer all sends in the block into a single OSC bundle.
+
+        Messages in a bundle are delivered in one packet and executed in
+        order, so no client-side pacing is needed between them. A nested
+        bundle without a delay merges into the enclosing one; a delayed
+        nested bundle is embedded with its own timetag. Empty bundles are
+        not sent.
+
+        Args:
+            dt: Seconds from now at which Bitwig should execute the bundle
+                (0 executes immediately)
+        """
+        if self._bundles and dt <= 0:
+            yield
+            return
+
+        timestamp = time.time() + dt if dt > 0 else IMMEDIATELY
+        contents: list[bytes] = []
+        self._bundles.append(contents)
+        try:
+            yield
+        finally:
+            self._bundles.pop()
+
+        if not contents:
+            return
+        dgram = encode_bundle(timestamp, contents)
+        if self._bundles:
+            self._bundles[-1].append(dgram)
+        else:
+            logger.debug("OSC BUNDLE: %d messages (+%ss)", len(contents), dt)
+            self._send_dgram(dgram)
+
+    @contextmanager
+    def touch(self, parameter: str) -> Iterator[None]:
+        """Hold a parameter touched across several value changes.
+
+        Volume, pan and device parameter setters otherwise touch and release
+        the parameter around every value, which triples the messages of a
+        sweep.
+
+        Args:
+            parameter: Parameter address without "/touched", e.g.
+                "/track/1/volume" or "/device/param/3"
+        """
+        self.send(f"{parameter}/touched", 1)
+        self._touched.add(parameter)
+        try:
+            yield
+        finally:
+            self._touched.discard(parameter)
+            self.send(f"{parameter}/touched", 0)
+
+    def _set_touched_value(self, parameter: str, value_address: str, value: int) -> None:
+        """Set a value that DrivenByMoss only applies reliably while touched."""
+        if parameter in self._touched:
+            self.send(value_address, value)
+            return
+        # Touch, set and release in one packet
+        with self.bundle():
+            self.send(f"{parameter}/touched", 1)
+            self.send(value_address, value)
+            self.send(f"{parameter}/touched", 0)
+
+    def _send_dgram(self, dgram: bytes) -> None:
+        """Send a raw OSC packet."""
+        for _ in range(2):
+            try:
+                self._sock.send(dgram)
+                return
+            except ConnectionRefusedError:
+                # A connected UDP socket reports an earlier ICMP "port
+                # unreachable" by failing the next send. The error is
+                # cleared once reported, so retry once.
+                continue
+        logger.debug("OSC SEND: nothing listening on %s:%s", self.send_host, self.send_port)
 
     # Transport Controls
     def play(self) -> None:
@@ -101,6 +346,17 @@ class BitwigOSCBridge:
         """
         self.send("/tempo/raw", bpm)
 
+    def set_vu_meters(self, enabled: bool) -> None:
+        """Enable or disable VU meter notifications from Bitwig.
+
+        Meters stream continuously while enabled; turn them off during
+        batch operations to keep the receive path quiet.
+
+        Args:
+            enabled: True to send meter updates, False to stop them
+        """
+        self.send("/vumeter", 1 if enabled else 0)
+
     def invoke_action(self, action_id: str) -> None:
         """Invoke a Bitwig action by its ID.
 
@@ -191,6 +447,24 @@ class BitwigOSCBridge:
         value = 1 if arm else (0 if arm is False else -1)
         self.send(f"/track/{index}/recarm", value)
 
+    def set_track_states(self, states: Iterable[tuple[int, str, Any]]) -> None:
+        """Set mute, solo, arm, volume or pan on several tracks in one bundle.
+
+        Args:
+            states: (track index, "mute" | "solo" | "arm" | "volume" | "pan",
+                value) triples, with values as for set_track_mute and friends
+        """
+        setters: dict[str, Callable[[int, Any], None]] = {
+            "mute": self.set_track_mute,
+            "solo": self.set_track_solo,
+            "arm": self.set_track_arm,
+            "volume": self.set_track_volume,
+            "pan": self.set_track_pan,
+        }
+        with self.bundle():
+            for index, state, value in states:
+                setters[state](index, value)
+
     def set_track_volume(self, index: int, value: float) -> None:
         """Set track volume.
 
@@ -198,12 +472,10 @@ class BitwigOSCBridge:
             index: Track index (1-indexed)
             value: Volume value (0.0 to 1.0)
         """
-        # Touch the fader first (required for reliable value changes)
-        self.send(f"/track/{index}/volume/touched", 1)
-        # DrivenByMoss uses 0-128 range
-        self.send(f"/track/{index}/volume", int(value * 128))
-        # Release the touch
-        self.send(f"/track/{index}/volume/touched", 0)
+        # The touch is required for reliable value changes, and addressing
+        # by index needs no selection. DrivenByMoss uses 0-128 range.
+        parameter = f"/track/{index}/volume"
+        self._set_touched_value(parameter, parameter, int(value * 128))
 
     def set_track_pan(self, index: int, value: float) -> None:
         """Set track pan.
@@ -212,13 +484,10 @@ class BitwigOSCBridge:
             index: Track index (1-indexed)
             value: Pan value (-1.0 = full left, 0.0 = center, 1.0 = full right)
         """
-        # Touch the fader first (required for reliable value changes)
-        self.send(f"/track/{index}/pan/touched", 1)
         # DrivenByMoss uses 0-128 range where 64 is center
         pan_value = int((value + 1.0) * 64)  # Convert -1..1 to 0..128
-        self.send(f"/track/{index}/pan", pan_value)
-        # Release the touch
-        self.send(f"/track/{index}/pan/touched", 0)
+        parameter = f"/track/{index}/pan"
+        self._set_touched_value(parameter, parameter, pan_value)
 
     # Device Operations
     def open_device_browser(self) -> None:
@@ -318,10 +587,8 @@ class BitwigOSCBridge:
             index: Parameter index (1-8)
             value: Parameter value (0.0 to 1.0)
         """
-        # Touch the parameter first (required for reliable value changes)
-        self.send(f"/device/param/{index}/touched", 1)
-        self.send(f"/device/param/{index}/value", int(value * 128))
-        self.send(f"/device/param/{index}/touched", 0)
+        parameter = f"/device/param/{index}"
+        self._set_touched_value(parameter, f"{parameter}/value", int(value * 128))
 
     # Clip Operations
     def create_clip(self, track: int, slot: int, length_beats: int = 4) -> None:
@@ -352,28 +619,214 @@ class BitwigOSCBridge:
         """
         self.send(f"/track/{track}/clip/{slot}/launch", 0)
 
+    def record_clip(self, track: int, slot: int, length_beats: int = 4) -> None:
+        """Create a clip and launch it for recording in one bundle.
+
+        Args:
+            track: Track index (1-indexed)
+            slot: Slot index (1-indexed)
+            length_beats: Clip length in beats
+        """
+        with self.bundle():
+            self.create_clip(track, slot, length_beats)
+            self.launch_clip(track, slot)
+
+    def launch_clips(self, clips: list[tuple[int, int]]) -> None:
+        """Launch several clips together in one bundle.
+
+        Args:
+            clips: (track, slot) pairs (1-indexed)
+        """
+        with self.bundle():
+            for track, slot in clips:
+                self.launch_clip(track, slot)
+
+    def stop_clips(self, clips: list[tuple[int, int]]) -> None:
+        """Stop several clips together in one bundle.
+
+        Args:
+            clips: (track, slot) pairs (1-indexed)
+        """
+        with self.bundle():
+            for track, slot in clips:
+                self.stop_clip(track, slot)
+
     def stop_all_clips(self) -> None:
         """Stop all playing clips."""
         self.send("/clip/stopall")
 
-    def insert_clip_file(self, track: int, slot: int, file_path: str) -> None:
+    def insert_clip_file(self, track: int, slot: int, file_path: str) -> ExpectedReply:
         """Insert a file (MIDI, audio) into a clip launcher slot.
 
         Args:
             track: Track index (1-indexed)
             slot: Slot index (1-indexed)
             file_path: Absolute path to the file to insert
+
+        Returns:
+            Event that is set when Bitwig reports the slot has content
+            (only if the OSC server is running)
         """
+        loaded = self.expect(f"/track/{track}/clip/{slot}/hasContent")
         self.send(f"/track/{track}/clip/{slot}/insertFile", file_path)
+        return loaded
+
+
+class AsyncBitwigOSCBridge(BitwigOSCBridge):
+    """OSC bridge that awaits Bitwig's replies on an asyncio event loop.
+
+    Sends are the same non-blocking UDP writes as BitwigOSCBridge; replies
+    are received on the running loop instead of a server thread, so
+    commands can await them rather than sleeping.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._transport: asyncio.DatagramTransport | None = None
+
+    async def __aenter__(self) -> "AsyncBitwigOSCBridge":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def start(self) -> None:
+        """Start receiving OSC messages from Bitwig on the running loop."""
+        if self._transport is not None:
+            return
+
+        from pythonosc.osc_server import AsyncIOOSCUDPServer
+
+        server = AsyncIOOSCUDPServer(
+            ("0.0.0.0", self.receive_port),
+            self.dispatcher,
+            # Stubbed as BaseEventLoop, but any running loop will do
+            cast(asyncio.BaseEventLoop, asyncio.get_running_loop()),
+        )
+        transport, _ = await server.create_serve_endpoint()
+        self._transport = cast(asyncio.DatagramTransport, transport)
+        _grow_receive_buffer(self._transport.get_extra_info("socket"))
+
+    def close(self) -> None:
+        """Stop receiving OSC messages."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def expect_reply(self, address: str) -> "asyncio.Future[tuple[Any, ...]]":
+        """Get a future for the arguments of Bitwig's next message to an address.
 
+        Like expect(), call this before sending the triggering command.
 
-# Global bridge instance
-_bridge: BitwigOSCBridge | None = None
+        Args:
+            address: OSC address to wait for (e.g., "/device/name")
+
+        Returns:
+            Future resolved with the message arguments
+        """
+        future: asyncio.Future[tuple[Any, ...]] = asyncio.get_running_loop().create_future()
+
+        def resolve(*args: Any) -> None:
+            if not future.done():
+                future.set_result(args)
+
+        def forget(_: asyncio.Future[tuple[Any, ...]]) -> None:
+            # A reply that is no longer awaited must not stay registered
+            if future.cancelled():
+                self._forget(address, resolve)
+
+        future.add_done_callback(forget)
+        with self._callbacks_lock:
+            self._callbacks.setdefault(address, []).append(resolve)
+        return future
+
+    async def wait_reply(
+        self, reply: "asyncio.Future[tuple[Any, ...]]", timeout: float
+    ) -> tuple[Any, ...] | None:
+        """Await a reply from expect_reply(), giving up after a timeout.
+
+        Args:
+            reply: Future from expect_reply()
+            timeout: Seconds to wait
+
+        Returns:
+            The message arguments, or None if Bitwig did not reply in time
+        """
+        try:
+            return await asyncio.wait_for(reply, timeout)
+        except TimeoutError:
+            return None
+
+    async def iter_devices(
+        self,
+        track: int,
+        count: int,
+        first_timeout: float = 0.8,
+        next_timeout: float = 0.2,
+        enabled_timeout: float = 0.02,
+    ) -> AsyncIterator[tuple[str, bool | None]]:
+        """Walk a track's device chain.
+
+        Selects the track, then steps through the chain with
+        select_next_device(), stopping when Bitwig stops reporting a new
+        device. Each step waits only until the reply arrives.
+
+        Args:
+            track: Track index (1-indexed)
+            count: Maximum number of devices to visit
+            first_timeout: Seconds to wait for the first device
+            next_timeout: Seconds to wait for each following device
+            enabled_timeout: Seconds to wait for the bypass state after the name
+
+        Yields:
+            (device name, bypassed) pairs; bypassed is None if not reported
+        """
+        prev_name = None
+        for i in range(count):
+            name_reply = self.expect_reply("/device/name")
+            enabled_reply = self.expect_reply("/device/isEnabled")
+
+            if i == 0:
+                self.select_track(track)
+            else:
+                self.select_next_device()
+
+            args = await self.wait_reply(name_reply, first_timeout if i == 0 else next_timeout)
+            if args is None:
+                enabled_reply.cancel()
+                return
+
+            name = args[0] if args else None
+            if not name or name == prev_name:
+                enabled_reply.cancel()
+                return  # No more devices or looped back
+
+            enabled = await self.wait_reply(enabled_reply, enabled_timeout)
+            bypassed = not enabled[0] if enabled else None
+
+            yield name, bypassed
+            prev_name = name
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop if it is installed.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    result: T = uvloop.run(main)
+    return result
 
 
+@functools.cache
 def get_bridge() -> BitwigOSCBridge:
     """Get or create the global OSC bridge instance."""
-    global _bridge
-    if _bridge is None:
-        _bridge = BitwigOSCBridge()
-    return _bridge
+    return BitwigOSCBridge()
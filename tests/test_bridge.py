@@ -0,0 +1,213 @@
+"""Tests for the OSC bridge."""
+
+import asyncio
+import socket
+import time
+
+import pytest
+from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder, build_msg
+
+from bwctl.osc.bridge import AsyncBitwigOSCBridge, BitwigOSCBridge, encode_message
+
+
+@pytest.fixture
+def receiver():
+    """A local UDP socket standing in for Bitwig."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def bridge(receiver):
+    """A bridge that sends to the local receiver."""
+    return BitwigOSCBridge(send_host="127.0.0.1", send_port=receiver.getsockname()[1])
+
+
+def test_send_message(bridge, receiver):
+    """Test a plain send is delivered as a single message."""
+    bridge.select_track(3)
+
+    msg = OscMessage(receiver.recv(4096))
+    assert msg.address == "/track/3/select"
+
+
+def test_bundle_buffers_sends(bridge, receiver):
+    """Test sends inside a bundle arrive as one packet, in order."""
+    with bridge.bundle():
+        bridge.set_track_volume(2, 0.5)
+        bridge.set_track_pan(2, 0.0)
+
+    dgram = receiver.recv(4096)
+    assert OscBundle.dgram_is_bundle(dgram)
+
+    addresses = [m.address for m in OscBundle(dgram)]
+    assert addresses == [
+        "/track/2/volume/touched",
+        "/track/2/volume",
+        "/track/2/volume/touched",
+        "/track/2/pan/touched",
+        "/track/2/pan",
+        "/track/2/pan/touched",
+    ]
+
+
+def test_bundle_discarded_on_error(bridge, receiver):
+    """Test a bundle is not sent when its block raises."""
+    with pytest.raises(RuntimeError):
+        with bridge.bundle():
+            bridge.play()
+            raise RuntimeError
+
+    receiver.settimeout(0.1)
+    with pytest.raises(socket.timeout):
+        receiver.recv(4096)
+
+
+def test_volume_is_single_packet(bridge, receiver):
+    """Test the touch/value/release triple goes out as one bundle."""
+    bridge.set_track_volume(1, 1.0)
+
+    bundle = OscBundle(receiver.recv(4096))
+    assert [(m.address, m.params) for m in bundle] == [
+        ("/track/1/volume/touched", [1]),
+        ("/track/1/volume", [128]),
+        ("/track/1/volume/touched", [0]),
+    ]
+
+
+def test_launch_clips_single_bundle(bridge, receiver):
+    """Test launching several clips sends one bundle."""
+    bridge.launch_clips([(1, 1), (2, 1), (3, 2)])
+
+    bundle = OscBundle(receiver.recv(4096))
+    assert [m.address for m in bundle] == [
+        "/track/1/clip/1/launch",
+        "/track/2/clip/1/launch",
+        "/track/3/clip/2/launch",
+    ]
+
+
+def test_empty_bundle_not_sent(bridge, receiver):
+    """Test an empty bundle sends nothing."""
+    bridge.launch_clips([])
+
+    receiver.settimeout(0.1)
+    with pytest.raises(socket.timeout):
+        receiver.recv(4096)
+
+
+def test_expect_set_on_reply(bridge):
+    """Test expect() fires once when a matching message is dispatched."""
+    event = bridge.expect("/track/1/clip/1/hasContent")
+    other = bridge.expect("/track/2/clip/1/hasContent")
+
+    reply = OscMessageBuilder(address="/track/1/clip/1/hasContent")
+    reply.add_arg(1)
+    bridge.dispatcher.call_handlers_for_packet(reply.build().dgram, ("127.0.0.1", 8000))
+
+    assert event.is_set()
+    assert not other.is_set()
+    assert "/track/1/clip/1/hasContent" not in bridge._callbacks
+
+
+def test_expect_forgotten_on_timeout(bridge):
+    """Test an expected reply that times out is unregistered from the bridge."""
+    event = bridge.expect("/track/1/clip/1/hasContent")
+
+    assert not event.wait(timeout=0.01)
+    assert "/track/1/clip/1/hasContent" not in bridge._callbacks
+
+
+def test_send_without_listener(receiver):
+    """Test sends to a closed port are dropped silently, like plain UDP."""
+    port = receiver.getsockname()[1]
+    receiver.close()
+    bridge = BitwigOSCBridge(send_host="127.0.0.1", send_port=port)
+
+    for _ in range(3):
+        bridge.play()
+        time.sleep(0.05)
+
+
+def test_iter_devices_stops_at_repeat(receiver):
+    """Test the device walk yields each reply and stops when Bitwig repeats."""
+    replies = iter([("Polymer", 1), ("Reverb", 0), ("Reverb", 0)])
+
+    async def scan():
+        bridge = AsyncBitwigOSCBridge(send_host="127.0.0.1", send_port=receiver.getsockname()[1])
+
+        def reply(*_args):
+            # Answer each select as Bitwig would: name, then enabled state
+            name, enabled = next(replies)
+            for address, arg in (("/device/name", name), ("/device/isEnabled", enabled)):
+                msg = OscMessageBuilder(address=address)
+                msg.add_arg(arg)
+                bridge.dispatcher.call_handlers_for_packet(msg.build().dgram, ("127.0.0.1", 8000))
+
+        bridge.select_track = reply
+        bridge.select_next_device = reply
+        return [d async for d in bridge.iter_devices(1, 8)]
+
+    assert asyncio.run(scan()) == [("Polymer", False), ("Reverb", True)]
+
+
+def test_set_track_states_single_bundle(bridge, receiver):
+    """Test multi-track mute/solo/arm goes out as one bundle."""
+    bridge.set_track_states([(1, "mute", True), (2, "solo", False), (3, "arm", None)])
+
+    bundle = OscBundle(receiver.recv(4096))
+    assert [(m.address, m.params) for m in bundle] == [
+        ("/track/1/mute", [1]),
+        ("/track/2/solo", [0]),
+        ("/track/3/recarm", [-1]),
+    ]
+
+
+def test_set_track_states_mixes_levels(bridge, receiver):
+    """Test volume and pan for several tracks share one datagram."""
+    bridge.set_track_states([(1, "volume", 0.5), (2, "pan", -0.25), (3, "mute", True)])
+
+    addresses = {m.address for m in OscBundle(receiver.recv(4096))}
+    assert {"/track/1/volume", "/track/2/pan", "/track/3/mute"} <= addresses
+    receiver.settimeout(0.05)
+    with pytest.raises(TimeoutError):
+        receiver.recv(4096)
+
+
+def test_touch_holds_parameter_across_values(bridge, receiver):
+    """Test values set inside touch() skip their own touch and release."""
+    with bridge.touch("/track/1/volume"):
+        bridge.set_track_volume(1, 0.25)
+        bridge.set_track_volume(1, 0.5)
+
+    messages = [OscMessage(receiver.recv(4096)) for _ in range(4)]
+    assert [(m.address, m.params) for m in messages] == [
+        ("/track/1/volume/touched", [1]),
+        ("/track/1/volume", [32]),
+        ("/track/1/volume", [64]),
+        ("/track/1/volume/touched", [0]),
+    ]
+
+
+def test_unanswered_reply_is_forgotten(receiver):
+    """Test a reply that times out is unregistered from the bridge."""
+    async def wait():
+        bridge = AsyncBitwigOSCBridge(send_host="127.0.0.1", send_port=receiver.getsockname()[1])
+        reply = bridge.expect_reply("/device/name")
+        assert await bridge.wait_reply(reply, 0.01) is None
+        return bridge
+
+    assert asyncio.run(wait())._callbacks == {}
+
+
+@pytest.mark.parametrize(
+    "args", [(64,), (-1,), (2**40,), (True,), (), (0.75,), ("Polymer",), ("",), (1, "a")]
+)
+def test_encode_message_matches_pythonosc(args):
+    """Test the fast paths encode exactly like pythonosc."""
+    assert encode_message("/track/3/volume", args) == build_msg("/track/3/volume", list(args)).dgram
@@ -0,0 +1,81 @@
+"""Tests for the CLI entry point."""
+
+from typer.testing import CliRunner
+
+from bwctl import __version__
+from bwctl.cli import LAZY_COMMANDS, app
+
+runner = CliRunner()
+
+
+def test_version():
+    """Test the version command."""
+    result = runner.invoke(app, ["version"])
+
+    assert result.exit_code == 0
+    assert __version__ in result.output
+
+
+def test_lazy_commands_resolve():
+    """Test every lazy command imports and shows help."""
+    for name in LAZY_COMMANDS:
+        result = runner.invoke(app, [name, "--help"])
+        assert result.exit_code == 0, name
+
+
+def test_repl_runs_commands():
+    """Test the REPL keeps going after each command, including failures."""
+    result = runner.invoke(app, ["repl"], input="version\nnot-a-command\nversion\nquit\n")
+
+    assert result.exit_code == 0
+    assert result.output.count(__version__) == 2
+
+
+def test_repl_survives_command_errors(monkeypatch):
+    """Test an exception raised by a command doesn't end the REPL."""
+    from bwctl.commands import search
+
+    def fail():
+        raise OSError("database unreachable")
+
+    monkeypatch.setattr(search, "get_stats", fail)
+    result = runner.invoke(app, ["repl"], input="stats\nversion\nquit\n")
+
+    assert result.exit_code == 0
+    assert "database unreachable" in result.output
+    assert __version__ in result.output
+
+
+def test_insert_browse_skips_lookup(monkeypatch):
+    """Test --browse opens the browser without resolving the target."""
+    from bwctl.commands import insert
+
+    def fail(**kwargs):
+        raise AssertionError("target was searched for")
+
+    monkeypatch.setattr(insert, "cached_search", fail)
+    result = runner.invoke(app, ["insert", "warm pad", "--browse", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "Would open browser for: warm pad" in result.output
+
+
+def test_insert_dotted_name_is_searched(monkeypatch):
+    """Test a query containing a dot is searched for, not opened as a file."""
+    from bwctl.commands import insert
+    from bwctl.db.models import ContentType, SearchResult
+
+    queries = []
+
+    def fake_search(query, limit):
+        queries.append(query)
+        return [SearchResult(
+            id=1, name="Vol. 2", content_type=ContentType.PRESET, file_path="/p/vol2.bwpreset"
+        )]
+
+    monkeypatch.setattr(insert, "cached_search", fake_search)
+    for target in ("Vol. 2", "missing.bwpreset"):
+        result = runner.invoke(app, ["insert", target, "--dry-run"])
+        assert result.exit_code == 0, result.output
+
+    assert queries == ["Vol. 2", "missing.bwpreset"]
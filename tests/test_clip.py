@@ -0,0 +1,18 @@
+"""Tests for clip commands."""
+
+import pytest
+
+from bwctl.commands.clip import parse_clip_ref
+
+
+def test_parse_clip_ref():
+    """Test parsing track:slot and bare slot references."""
+    assert parse_clip_ref("3:2") == (3, 2)
+    assert parse_clip_ref("4") == (1, 4)
+
+
+@pytest.mark.parametrize("ref", ["", "a:1", "1:", "1:2:3", "1:-2"])
+def test_parse_clip_ref_invalid(ref):
+    """Test malformed references raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_clip_ref(ref)
@@ -0,0 +1,123 @@
+"""Tests for the content indexer."""
+
+import hashlib
+import wave
+from datetime import datetime
+
+from bwctl.db.indexer import (
+    _is_unchanged,
+    compute_file_hash,
+    discover_content,
+    get_device_type,
+    get_wav_info,
+    index_file,
+    parse_preset_name,
+)
+from bwctl.db.models import DeviceType
+
+
+def test_compute_file_hash(tmp_path):
+    """Test the file hash is the SHA-256 of the whole file."""
+    data = bytes(range(256)) * 4099  # Not a multiple of any read size
+    path = tmp_path / "kick.wav"
+    path.write_bytes(data)
+
+    assert compute_file_hash(path) == hashlib.sha256(data).hexdigest()
+
+    path.write_bytes(b"")
+    assert compute_file_hash(path) == hashlib.sha256(b"").hexdigest()
+
+
+def test_index_file_hashes_samples_on_request(tmp_path):
+    """Test samples are only hashed when asked, and presets never."""
+    sample = tmp_path / "kick.ogg"
+    sample.write_bytes(b"OggS")
+    preset = tmp_path / "Pad.bwpreset"
+    preset.write_bytes(b"BtWg")
+
+    assert index_file(sample).file_hash is None
+    assert index_file(sample, compute_hash=True).file_hash == hashlib.sha256(b"OggS").hexdigest()
+    assert index_file(preset, compute_hash=True).file_hash is None
+
+
+def test_is_unchanged(tmp_path):
+    """Test files are skipped only when size and mtime match the index."""
+    path = tmp_path / "Pad.bwpreset"
+    path.write_bytes(b"BtWg")
+    stat = path.stat()
+    modified_at = datetime.fromtimestamp(stat.st_mtime)
+
+    assert _is_unchanged(path, stat, {str(path): (stat.st_size, modified_at, None)})
+    assert not _is_unchanged(path, stat, {str(path): (stat.st_size + 1, modified_at, None)})
+    assert not _is_unchanged(path, stat, {})
+
+
+def test_parse_preset_name():
+    """Test category prefixes and keyword tags are picked out of names."""
+    assert parse_preset_name("Bass - Analog Warm Pad") == {
+        "category": "Bass",
+        "tags": ["analog", "warm", "pad"],
+    }
+    assert parse_preset_name("[Keys] Vintage EP") == {"category": "Keys", "tags": ["vintage"]}
+    assert parse_preset_name("Warmth")["tags"] == []
+
+
+def test_get_device_type():
+    """Test the first matching pattern decides the device type."""
+    assert get_device_type("Polymer") == DeviceType.INSTRUMENT
+    assert get_device_type("EQ Synth") == DeviceType.INSTRUMENT
+    assert get_device_type("Delay+") == DeviceType.AUDIO_FX
+    assert get_device_type("Unknown") is None
+
+
+def test_discover_content(tmp_path):
+    """Test content files are found once each, at any depth and case."""
+    (tmp_path / "Presets" / "Polymer").mkdir(parents=True)
+    (tmp_path / "Presets" / "Polymer" / "Pad.bwpreset").touch()
+    (tmp_path / "Samples").mkdir()
+    (tmp_path / "Samples" / "Kick.WAV").touch()
+    (tmp_path / "Samples" / "notes.txt").touch()
+
+    found = sorted(p.relative_to(tmp_path).as_posix() for p in discover_content(tmp_path))
+
+    assert found == ["Presets/Polymer/Pad.bwpreset", "Samples/Kick.WAV"]
+
+
+def test_index_file_parent_device(tmp_path):
+    """Test presets take their device from the folder below Presets."""
+    device_dir = tmp_path / "Presets" / "Polymer"
+    device_dir.mkdir(parents=True)
+    (device_dir / "Pad.bwpreset").touch()
+    (tmp_path / "Presets" / "Loose.bwpreset").touch()
+
+    assert index_file(device_dir / "Pad.bwpreset").parent_device == "Polymer"
+    assert index_file(tmp_path / "Presets" / "Loose.bwpreset").parent_device is None
+
+
+def test_get_wav_info(tmp_path):
+    """Test WAV properties are read from the file's headers."""
+    path = tmp_path / "kick.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(48000)
+        wav.writeframes(b"\0" * 4 * 24000)
+
+    assert get_wav_info(path) == {"sample_rate": 48000, "channels": 2, "duration_ms": 500}
+
+    path.write_bytes(b"not a wav")
+    assert get_wav_info(path) == {}
+
+
+def test_get_wav_info_short_fmt_chunk(tmp_path):
+    """Test a fmt chunk too short to hold the format is rejected."""
+    import struct
+
+    path = tmp_path / "broken.wav"
+    # Format tag, channels and sample rate, then the chunk ends early
+    short_fmt = b"fmt " + struct.pack("<I", 8) + struct.pack("<HHI", 1, 2, 48000)
+    data = b"data" + struct.pack("<I", 8) + b"\0" * 8
+    body = b"WAVE" + short_fmt + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+    assert get_wav_info(path) == {}
@@ -33,3 +33,81 @@ def test_content_type_enum():
     assert ContentType.PRESET.value == "preset"
     assert ContentType.SAMPLE.value == "sample"
     assert ContentType("preset") == ContentType.PRESET
+
+
+def test_cached_search(tmp_path, monkeypatch):
+    """Test search results are reused until the cache is cleared."""
+    from bwctl.db import cache
+
+    calls = []
+
+    def fake_search(**kwargs):
+        calls.append(kwargs)
+        return [SearchResult(
+            id=7,
+            name="Sub Kick",
+            content_type=ContentType.PRESET,
+            file_path="/path/to/kick.bwpreset",
+        )]
+
+    monkeypatch.setattr(cache, "get_search_cache_path", lambda: tmp_path / "bwctl" / "search.json")
+    monkeypatch.setattr(cache, "search_content", fake_search)
+
+    first = cache.cached_search("kick", ContentType.PRESET, limit=5)
+    second = cache.cached_search("kick", ContentType.PRESET, limit=5)
+
+    assert len(calls) == 1
+    assert first == second
+    assert second[0].content_type == ContentType.PRESET
+
+    # Case and surrounding whitespace don't change database results
+    cache.cached_search("  Kick ", ContentType.PRESET, limit=5)
+    assert len(calls) == 1
+
+    cache.clear_search_cache()
+    cache.cached_search("kick", ContentType.PRESET, limit=5)
+    assert len(calls) == 2
+
+
+def test_cached_search_expires(tmp_path, monkeypatch):
+    """Test cached results older than the TTL are searched again."""
+    from bwctl.config import get_settings
+    from bwctl.db import cache
+
+    calls = []
+
+    def fake_search(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(cache, "get_search_cache_path", lambda: tmp_path / "search.json")
+    monkeypatch.setattr(cache, "search_content", fake_search)
+    monkeypatch.setattr(get_settings().search, "cache_ttl", 0.0)
+
+    cache.cached_search("kick")
+    cache.cached_search("kick")
+
+    assert len(calls) == 2
+
+
+def test_search_json_output_is_verbatim(monkeypatch):
+    """Test JSON output keeps names and long paths exactly as stored."""
+    import json
+
+    from typer.testing import CliRunner
+
+    from bwctl.cli import app
+    from bwctl.commands import search
+
+    result = SearchResult(
+        id=1,
+        name="[Bass] Deep Sub",
+        content_type=ContentType.PRESET,
+        file_path="/very/long/" + "x" * 200 + ".bwpreset",
+    )
+    monkeypatch.setattr(search, "cached_search", lambda **kwargs: [result])
+
+    output = CliRunner().invoke(app, ["search", "bass", "-o", "json"]).output
+
+    assert json.loads(output)[0]["name"] == "[Bass] Deep Sub"
+    assert json.loads(output)[0]["file_path"] == result.file_path
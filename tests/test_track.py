@@ -0,0 +1,44 @@
+"""Tests for track commands."""
+
+import asyncio
+import time
+
+from typer.testing import CliRunner
+
+from bwctl.commands.track import QUIET_PERIOD, app, wait_for_burst
+
+runner = CliRunner()
+
+
+def test_wait_for_burst_returns_when_quiet():
+    """Test the wait ends shortly after the feedback stops, not at the timeout."""
+    async def run():
+        activity = asyncio.Event()
+
+        async def burst():
+            for _ in range(5):
+                activity.set()
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(burst())
+        await wait_for_burst(activity, timeout=2.0)
+        await task
+
+    start = time.monotonic()
+    asyncio.run(run())
+
+    assert time.monotonic() - start < 0.05 + 3 * QUIET_PERIOD
+
+
+def test_wait_for_burst_times_out_without_reply():
+    """Test the wait gives up at the timeout if nothing arrives."""
+    start = time.monotonic()
+    asyncio.run(wait_for_burst(asyncio.Event(), timeout=0.1))
+
+    assert 0.1 <= time.monotonic() - start < 0.5
+
+
+def test_out_of_range_values_rejected_by_parser():
+    """Test bad volume/type values fail in argument parsing, before any OSC."""
+    assert runner.invoke(app, ["volume", "1", "1.5"]).exit_code == 2
+    assert runner.invoke(app, ["add", "-t", "midi"]).exit_code == 2